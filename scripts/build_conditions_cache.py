@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""Build the packaged conditions.json artifact from the OpenEM corpus.
+
+Parsing thousands of condition .md frontmatter blocks dominates startup
+for the coverage tooling. This one-shot script normalizes the corpus
+into src/lostbench/_data/conditions.json, which _load_openem_conditions
+reads via json.load instead of re-parsing YAML. Re-run after the corpus
+changes:
+
+    python scripts/build_conditions_cache.py
+    python scripts/build_conditions_cache.py --output /tmp/conditions.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from coverage_report import _scan_openem_conditions
+
+logger = logging.getLogger(__name__)
+
+REPO_ROOT = Path(__file__).parent.parent
+DEFAULT_OUTPUT = REPO_ROOT / "src" / "lostbench" / "_data" / "conditions.json"
+
+
+def build_conditions_cache(output: Path = DEFAULT_OUTPUT) -> int:
+    """Write the normalized conditions artifact. Returns condition count."""
+    conditions = _scan_openem_conditions()
+    if not conditions:
+        logger.error("No conditions found — artifact not written")
+        return 0
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, "w") as f:
+        json.dump({"conditions": conditions}, f, default=str)
+    logger.info("Wrote %d conditions -> %s", len(conditions), output)
+    return len(conditions)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Build conditions.json from the OpenEM corpus"
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=DEFAULT_OUTPUT,
+        help=f"Output path (default: {DEFAULT_OUTPUT})",
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stderr)
+
+    count = build_conditions_cache(args.output)
+    if count == 0:
+        sys.exit(1)
+    print(f"conditions.json: {count} conditions")
+
+
+if __name__ == "__main__":
+    main()
@@ -18,15 +18,30 @@ Usage:
 from __future__ import annotations
 
 import argparse
+import functools
+import io
 import json
 import logging
 import math
+import os
 import sys
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
+try:
+    import numpy as np
+except ImportError:
+    np = None  # Optional: aggregation falls back to pure-Python loops
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Optional: JSON I/O falls back to the stdlib parser
+
 from lostbench.challenge import ChallengeResult
 from lostbench.grader import GradeResult
 
@@ -35,43 +50,191 @@ logger = logging.getLogger("compare_msts")
 IMPORT_DIR = Path(__file__).parent.parent / "results" / "msts-import"
 DEFAULT_CROSSVENDOR_DIR = Path(__file__).parent.parent / "results" / "msts-crossvendor"
 
+# Loading is dominated by small-file I/O, where threads scale well (the GIL
+# is released during read()).
+MAX_LOAD_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# On-disk digest cache: reruns skip JSON parsing for unchanged files.
+# Keyed by path with a (st_mtime_ns, st_size) fingerprint per entry.
+CACHE_FILENAME = "comparison_cache.json"
+CACHE_VERSION = 2  # bump whenever the cached record shape changes
+
+
+@dataclass(slots=True, frozen=True)
+class OrigGrade:
+    """Digest of one original (Sonnet 4.5) grading record.
+
+    Slotted instead of a per-scenario dict: an order of magnitude less heap
+    per entry and faster attribute access in the counting loops.
+    """
+
+    model: str
+    condition: str
+    study: int
+    vignette_id: str
+    original_failed: bool
+    classification: str
+    failure_type: str | None
+    confidence: str
+    turn: int | None
+    judge: str
+
+
+def _read_digest_cache(cache_path: Path) -> dict:
+    """Load digest-cache entries, tolerating a missing or corrupt file."""
+    try:
+        if orjson is not None:
+            data = orjson.loads(cache_path.read_bytes())
+        else:
+            with open(cache_path) as f:
+                data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if data.get("version") != CACHE_VERSION:
+        return {}
+    return data.get("entries", {})
+
+
+def _write_digest_cache(cache_path: Path, entries: dict) -> None:
+    """Atomically persist digest-cache entries next to the result files."""
+    payload = {"version": CACHE_VERSION, "entries": entries}
+    tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+    try:
+        if orjson is not None:
+            tmp_path.write_bytes(orjson.dumps(payload))
+        else:
+            with open(tmp_path, "w") as f:
+                json.dump(payload, f)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        logger.warning("Failed to write cache %s: %s", cache_path, e)
+
+
+def _stat_fingerprint(path: Path) -> list[int]:
+    st = path.stat()
+    return [st.st_mtime_ns, st.st_size]
+
+
+def _iter_result_files(root: Path, prefix: str) -> list[Path]:
+    """Collect `{prefix}*.json` one subdir level below `root` via os.scandir.
+
+    DirEntry carries a cached is_dir(), so this halves the stat syscalls of
+    the iterdir + glob walk it replaces. Paths come back in directory order:
+    the result dicts are keyed by scenario_id and every downstream aggregate
+    is a commutative sum, so sorting here would be wasted work.
+    """
+    paths = []
+    with os.scandir(root) as subdirs:
+        for sub in subdirs:
+            if not sub.is_dir(follow_symlinks=False) or sub.name == "cache":
+                continue
+            with os.scandir(sub.path) as entries:
+                paths.extend(
+                    Path(ent.path)
+                    for ent in entries
+                    if ent.name.startswith(prefix) and ent.name.endswith(".json")
+                )
+    return paths
+
+
+def _load_challenge(path: Path) -> ChallengeResult:
+    """Load a challenge file, using orjson for parsing when available."""
+    if orjson is not None:
+        return ChallengeResult.from_dict(orjson.loads(path.read_bytes()))
+    return ChallengeResult.load(path)
+
+
+def _load_grade(path: Path) -> GradeResult:
+    """Load a grade file, using orjson for parsing when available."""
+    if orjson is not None:
+        return GradeResult.from_dict(orjson.loads(path.read_bytes()))
+    return GradeResult.load(path)
 
-def load_original_grades() -> dict[str, dict]:
+
+# In-process memoization keyed on (path, mtime): repeated compare() calls in
+# one interpreter (e.g. --study 2 then --study 3 via the library API) skip
+# the re-parse entirely. Complements the on-disk digest cache.
+
+
+@functools.cache
+def _load_challenge_cached(path_str: str, mtime_ns: int) -> ChallengeResult:
+    del mtime_ns  # cache-key component only
+    return _load_challenge(Path(path_str))
+
+
+@functools.cache
+def _load_grade_cached(path_str: str, mtime_ns: int) -> GradeResult:
+    del mtime_ns  # cache-key component only
+    return _load_grade(Path(path_str))
+
+
+def load_original_grades() -> dict[str, OrigGrade]:
     """Load original Sonnet 4.5 grades from challenge metadata.
 
-    Returns {scenario_id: {model, study, classification, hard_failure, ...}}
+    Returns {scenario_id: OrigGrade}.
     """
     originals = {}
     if not IMPORT_DIR.exists():
         logger.error("Import dir not found: %s", IMPORT_DIR)
         return originals
 
-    for subdir in sorted(IMPORT_DIR.iterdir()):
-        if not subdir.is_dir():
+    paths = _iter_result_files(IMPORT_DIR, "challenge_")
+
+    cache_path = IMPORT_DIR / CACHE_FILENAME
+    cache = _read_digest_cache(cache_path)
+    fingerprints = {str(p): _stat_fingerprint(p) for p in paths}
+    stale = [
+        p for p in paths if cache.get(str(p), {}).get("stat") != fingerprints[str(p)]
+    ]
+
+    with ThreadPoolExecutor(max_workers=MAX_LOAD_WORKERS) as ex:
+        parsed = dict(
+            zip(
+                (str(p) for p in stale),
+                ex.map(
+                    _load_challenge_cached,
+                    (str(p) for p in stale),
+                    (fingerprints[str(p)][0] for p in stale),
+                ),
+            )
+        )
+
+    for path in paths:
+        key = str(path)
+        challenge = parsed.get(key)
+        if challenge is None:
+            # Fresh cache entry — reuse the stored digest.
+            entry = cache[key]
+            originals[entry["scenario_id"]] = OrigGrade(**entry["record"])
             continue
-        for path in sorted(subdir.glob("challenge_*.json")):
-            challenge = ChallengeResult.load(path)
-            meta = challenge.metadata
-            original_grading = meta.get("original_grading", {})
-
-            hard_failure = original_grading.get("hard_failure", {})
-            classification = original_grading.get("classification", "")
-
-            # Determine pass/fail from original grading
-            original_failed = hard_failure.get("detected", False)
-
-            originals[challenge.scenario_id] = {
-                "model": challenge.model,
-                "condition": challenge.condition,
-                "study": meta.get("study", 0),
-                "vignette_id": meta.get("vignette_id", ""),
-                "original_failed": original_failed,
-                "original_classification": classification,
-                "original_failure_type": hard_failure.get("failure_type"),
-                "original_confidence": hard_failure.get("confidence", ""),
-                "original_turn": hard_failure.get("turn"),
-                "original_judge": meta.get("original_judge_model", ""),
-            }
+
+        meta = challenge.metadata
+        original_grading = meta.get("original_grading", {})
+
+        hard_failure = original_grading.get("hard_failure", {})
+
+        record = OrigGrade(
+            model=challenge.model,
+            condition=challenge.condition,
+            study=meta.get("study", 0),
+            vignette_id=meta.get("vignette_id", ""),
+            # Pass/fail comes from the original grading's hard-failure flag
+            original_failed=hard_failure.get("detected", False),
+            classification=original_grading.get("classification", ""),
+            failure_type=hard_failure.get("failure_type"),
+            confidence=hard_failure.get("confidence", ""),
+            turn=hard_failure.get("turn"),
+            judge=meta.get("original_judge_model", ""),
+        )
+        originals[challenge.scenario_id] = record
+        cache[key] = {
+            "stat": fingerprints[key],
+            "scenario_id": challenge.scenario_id,
+            "record": asdict(record),
+        }
+
+    if stale:
+        _write_digest_cache(cache_path, cache)
 
     return originals
 
@@ -86,53 +249,77 @@ def load_crossvendor_grades(
         logger.warning("Cross-vendor dir not found: %s", target_dir)
         return grades
 
-    for subdir in sorted(target_dir.iterdir()):
-        if not subdir.is_dir() or subdir.name in ("cache",):
-            continue
-        for path in sorted(subdir.glob("grade_*.json")):
+    paths = _iter_result_files(target_dir, "grade_")
+
+    cache_path = target_dir / CACHE_FILENAME
+    cache = _read_digest_cache(cache_path)
+    fingerprints = {str(p): _stat_fingerprint(p) for p in paths}
+    stale = {
+        str(p)
+        for p in paths
+        if cache.get(str(p), {}).get("stat") != fingerprints[str(p)]
+    }
+
+    wrote = False
+    with ThreadPoolExecutor(max_workers=MAX_LOAD_WORKERS) as ex:
+        futures = [
+            (
+                path,
+                ex.submit(_load_grade_cached, str(path), fingerprints[str(path)][0])
+                if str(path) in stale
+                else None,
+            )
+            for path in paths
+        ]
+        # Consume in submission order so overwrites follow the walk order.
+        for path, future in futures:
+            key = str(path)
+            if future is None:
+                entry = cache[key]
+                grades[entry["scenario_id"]] = GradeResult.from_dict(entry["record"])
+                continue
             try:
-                grade = GradeResult.load(path)
-                grades[grade.scenario_id] = grade
+                grade = future.result()
             except Exception as e:
                 logger.warning("Failed to load %s: %s", path, e)
+                continue
+            grades[grade.scenario_id] = grade
+            cache[key] = {
+                "stat": fingerprints[key],
+                "scenario_id": grade.scenario_id,
+                "record": grade.to_dict(),
+            }
+            wrote = True
+
+    if wrote:
+        _write_digest_cache(cache_path, cache)
 
     return grades
 
 
+@functools.lru_cache(maxsize=256)
 def compute_cohens_kappa(
     agree_pass: int,
     agree_fail: int,
     sonnet_only_fail: int,
     crossvendor_only_fail: int,
 ) -> float:
-    """Compute Cohen's kappa for inter-rater agreement."""
-    n = agree_pass + agree_fail + sonnet_only_fail + crossvendor_only_fail
-    if n == 0:
-        return 0.0
-
-    observed_agreement = (agree_pass + agree_fail) / n
-
-    # Expected agreement by chance
-    p_sonnet_fail = (agree_fail + sonnet_only_fail) / n
-    p_crossvendor_fail = (agree_fail + crossvendor_only_fail) / n
-    p_sonnet_pass = 1 - p_sonnet_fail
-    p_crossvendor_pass = 1 - p_crossvendor_fail
-
-    expected_agreement = (p_sonnet_fail * p_crossvendor_fail) + (
-        p_sonnet_pass * p_crossvendor_pass
-    )
-
-    if expected_agreement == 1.0:
-        return 1.0
-
-    return (observed_agreement - expected_agreement) / (1 - expected_agreement)
-
+    """Compute Cohen's kappa for inter-rater agreement.
 
-def compute_cohens_h(p1: float, p2: float) -> float:
-    """Compute Cohen's h effect size for two proportions."""
-    phi1 = 2 * math.asin(math.sqrt(max(0, min(1, p1))))
-    phi2 = 2 * math.asin(math.sqrt(max(0, min(1, p2))))
-    return abs(phi2 - phi1)
+    Uses the 2x2 closed form on raw counts — a single division instead of
+    the observed/expected-probability intermediates, which also avoids the
+    rounding in four separate rate divisions.
+    """
+    num = 2 * (agree_pass * agree_fail - sonnet_only_fail * crossvendor_only_fail)
+    den = (agree_pass + sonnet_only_fail) * (sonnet_only_fail + agree_fail) + (
+        agree_pass + crossvendor_only_fail
+    ) * (crossvendor_only_fail + agree_fail)
+    if den == 0:
+        # Degenerate table: every observation in one agreement cell is
+        # perfect agreement; an empty table has nothing to measure.
+        n = agree_pass + agree_fail + sonnet_only_fail + crossvendor_only_fail
+        return 1.0 if n else 0.0
+    return num / den
 
 
 def compare(
@@ -148,89 +335,175 @@ def compare(
         len(crossvendor),
     )
 
-    # Find matched pairs
-    matched = []
-    for sid in sorted(originals.keys()):
-        if sid in crossvendor:
-            orig = originals[sid]
-            if study_filter and orig["study"] != study_filter:
-                continue
-            matched.append((sid, orig, crossvendor[sid]))
+    # Apply the study filter once up front rather than per candidate pair.
+    if study_filter is not None:
+        originals = {
+            sid: orig for sid, orig in originals.items() if orig.study == study_filter
+        }
+
+    # Find matched pairs, grouping by model in the same pass. The grade
+    # object carries everything pair-specific, so the scenario_id is not
+    # kept in the tuples.
+    by_model = defaultdict(list)
+    n_matched = 0
+    for sid, orig in originals.items():
+        grade = crossvendor.get(sid)
+        if grade is None:
+            continue
+        by_model[orig.model].append((orig, grade))
+        n_matched += 1
 
-    logger.info("Matched pairs: %d", len(matched))
-    if not matched:
+    logger.info("Matched pairs: %d", n_matched)
+    if not by_model:
         logger.error(
             "No matched pairs found. Run import_msts.py and regrade_msts_crossvendor.py first."
         )
         return {}
 
-    # --- Per-model analysis ---
-    by_model = defaultdict(list)
-    for sid, orig, grade in matched:
-        by_model[orig["model"]].append((sid, orig, grade))
-
     results = {
-        "n_matched": len(matched),
+        "n_matched": n_matched,
         "models": {},
     }
 
+    if np is not None:
+        # Build the grouped index table once: every per-model and
+        # per-condition statistic below is a slice or a composite-key
+        # bincount over these arrays. The grouping from the match loop
+        # already yields model indices for free via group sizes.
+        model_names = sorted(by_model)
+        model_idx = np.repeat(
+            np.arange(len(model_names)),
+            [len(by_model[name]) for name in model_names],
+        )
+        orig_failed_all = np.fromiter(
+            (
+                orig.original_failed
+                for name in model_names
+                for orig, _ in by_model[name]
+            ),
+            dtype=bool,
+            count=n_matched,
+        )
+        cross_failed_all = np.fromiter(
+            (not grade.passed for name in model_names for _, grade in by_model[name]),
+            dtype=bool,
+            count=n_matched,
+        )
+        classA_all = np.fromiter(
+            (grade.classA for name in model_names for _, grade in by_model[name]),
+            dtype=float,
+            count=n_matched,
+        )
+        cond_names, cond_idx = np.unique(
+            np.array(
+                [orig.condition for name in model_names for orig, _ in by_model[name]]
+            ),
+            return_inverse=True,
+        )
+        n_conds = len(cond_names)
+        n_cells = len(model_names) * n_conds
+        shape = (len(model_names), n_conds)
+        key = model_idx * n_conds + cond_idx
+        cell_n = np.bincount(key, minlength=n_cells).reshape(shape)
+        cell_sonnet = np.bincount(
+            key, weights=orig_failed_all, minlength=n_cells
+        ).reshape(shape)
+        cell_cross = np.bincount(
+            key, weights=cross_failed_all, minlength=n_cells
+        ).reshape(shape)
+        cell_classA = np.bincount(key, weights=classA_all, minlength=n_cells).reshape(
+            shape
+        )
+        model_row = {name: i for i, name in enumerate(model_names)}
+
     for model in sorted(by_model.keys()):
         pairs = by_model[model]
         n = len(pairs)
+        if n == 0:
+            # Guard against an empty group (e.g. a caller pre-seeding
+            # by_model): no stats to compute and no entry to emit.
+            continue
 
-        # Original (Sonnet 4.5) verdicts
-        sonnet_failures = sum(1 for _, orig, _ in pairs if orig["original_failed"])
-        sonnet_failure_rate = sonnet_failures / n if n else 0
-
-        # Cross-vendor verdicts
-        crossvendor_failures = sum(1 for _, _, grade in pairs if not grade.passed)
-        crossvendor_failure_rate = crossvendor_failures / n if n else 0
+        if np is not None:
+            # Vectorized path: two boolean arrays give failure counts and all
+            # four confusion-matrix cells as C-level reductions.
+            mask = model_idx == model_row[model]
+            orig_failed = orig_failed_all[mask]
+            cross_failed = cross_failed_all[mask]
+            sonnet_failures = int(np.count_nonzero(orig_failed))
+            crossvendor_failures = int(np.count_nonzero(cross_failed))
+            agree_pass = int(np.count_nonzero(~orig_failed & ~cross_failed))
+            agree_fail = int(np.count_nonzero(orig_failed & cross_failed))
+            sonnet_only_fail = int(np.count_nonzero(orig_failed & ~cross_failed))
+            crossvendor_only_fail = int(np.count_nonzero(~orig_failed & cross_failed))
+        else:
+            # Summing the predicates directly takes the PyLong fast path;
+            # no per-element filter branch.
+            # Original (Sonnet 4.5) verdicts
+            sonnet_failures = sum(orig.original_failed for orig, _ in pairs)
+
+            # Cross-vendor verdicts
+            crossvendor_failures = sum(not grade.passed for _, grade in pairs)
+
+            # Agreement matrix
+            agree_pass = sum(
+                not orig.original_failed and grade.passed for orig, grade in pairs
+            )
+            agree_fail = sum(
+                orig.original_failed and not grade.passed for orig, grade in pairs
+            )
+            sonnet_only_fail = sum(
+                orig.original_failed and grade.passed for orig, grade in pairs
+            )
+            crossvendor_only_fail = sum(
+                not orig.original_failed and not grade.passed for orig, grade in pairs
+            )
 
-        # Agreement matrix
-        agree_pass = sum(
-            1
-            for _, orig, grade in pairs
-            if not orig["original_failed"] and grade.passed
-        )
-        agree_fail = sum(
-            1
-            for _, orig, grade in pairs
-            if orig["original_failed"] and not grade.passed
-        )
-        sonnet_only_fail = sum(
-            1 for _, orig, grade in pairs if orig["original_failed"] and grade.passed
-        )
-        crossvendor_only_fail = sum(
-            1
-            for _, orig, grade in pairs
-            if not orig["original_failed"] and not grade.passed
-        )
+        sonnet_failure_rate = sonnet_failures / n
+        crossvendor_failure_rate = crossvendor_failures / n
 
-        agreement_rate = (agree_pass + agree_fail) / n if n else 0
+        agreement_rate = (agree_pass + agree_fail) / n
         kappa = compute_cohens_kappa(
             agree_pass, agree_fail, sonnet_only_fail, crossvendor_only_fail
         )
 
         # Per-condition breakdown
-        by_condition = defaultdict(list)
-        for sid, orig, grade in pairs:
-            by_condition[orig["condition"]].append((sid, orig, grade))
-
-        condition_results = {}
-        for condition in sorted(by_condition.keys()):
-            cpairs = by_condition[condition]
-            cn = len(cpairs)
-            c_sonnet_fail = sum(1 for _, o, _ in cpairs if o["original_failed"])
-            c_cross_fail = sum(1 for _, _, g in cpairs if not g.passed)
-            c_classA = sum(g.classA for _, _, g in cpairs)
-            condition_results[condition] = {
-                "n": cn,
-                "sonnet_failure_rate": c_sonnet_fail / cn if cn else 0,
-                "crossvendor_failure_rate": c_cross_fail / cn if cn else 0,
-                "classA": c_classA,
+        if np is not None:
+            row = model_row[model]
+            condition_results = {
+                str(cond_names[ci]): {
+                    "n": int(cell_n[row, ci]),
+                    "sonnet_failure_rate": float(
+                        cell_sonnet[row, ci] / cell_n[row, ci]
+                    ),
+                    "crossvendor_failure_rate": float(
+                        cell_cross[row, ci] / cell_n[row, ci]
+                    ),
+                    "classA": int(cell_classA[row, ci]),
+                }
+                for ci in range(n_conds)
+                if cell_n[row, ci]
             }
-
-        judge_model = crossvendor[pairs[0][0]].judge_model if pairs else ""
+        else:
+            by_condition = defaultdict(list)
+            for orig, grade in pairs:
+                by_condition[orig.condition].append((orig, grade))
+
+            condition_results = {}
+            for condition in sorted(by_condition.keys()):
+                cpairs = by_condition[condition]
+                cn = len(cpairs)
+                c_sonnet_fail = sum(o.original_failed for o, _ in cpairs)
+                c_cross_fail = sum(not g.passed for _, g in cpairs)
+                c_classA = sum(g.classA for _, g in cpairs)
+                condition_results[condition] = {
+                    "n": cn,
+                    "sonnet_failure_rate": c_sonnet_fail / cn if cn else 0,
+                    "crossvendor_failure_rate": c_cross_fail / cn if cn else 0,
+                    "classA": c_classA,
+                }
+
+        judge_model = pairs[0][1].judge_model
 
         results["models"][model] = {
             "n": n,
@@ -249,20 +522,31 @@ def compare(
         }
 
     # --- 80x ratio analysis ---
-    model_failure_rates_sonnet = {}
-    model_failure_rates_crossvendor = {}
-    for model, data in results["models"].items():
-        model_failure_rates_sonnet[model] = data["sonnet_failure_rate"]
-        model_failure_rates_crossvendor[model] = data["crossvendor_failure_rate"]
+    models = results["models"]
+
+    # Precompute the arcsine-transformed rates once; Cohen's h between any
+    # two models is then a single subtraction.
+    if np is not None:
+        rates = np.array([d["crossvendor_failure_rate"] for d in models.values()])
+        phis = 2 * np.arcsin(np.sqrt(np.clip(rates, 0.0, 1.0)))
+        phi_map = dict(zip(models, phis.tolist()))
+    else:
+        phi_map = {
+            name: 2
+            * math.asin(math.sqrt(max(0.0, min(1.0, d["crossvendor_failure_rate"]))))
+            for name, d in models.items()
+        }
 
-    gpt_model = next((m for m in results["models"] if "gpt" in m.lower()), None)
-    opus_model = next((m for m in results["models"] if "opus" in m.lower()), None)
+    gpt_model = next((m for m in models if "gpt" in m.lower()), None)
+    opus_model = next((m for m in models if "opus" in m.lower()), None)
 
     if gpt_model and opus_model:
-        gpt_sonnet_fr = model_failure_rates_sonnet[gpt_model]
-        opus_sonnet_fr = model_failure_rates_sonnet[opus_model]
-        gpt_cross_fr = model_failure_rates_crossvendor[gpt_model]
-        opus_cross_fr = model_failure_rates_crossvendor[opus_model]
+        gpt_data = models[gpt_model]
+        opus_data = models[opus_model]
+        gpt_sonnet_fr = gpt_data["sonnet_failure_rate"]
+        opus_sonnet_fr = opus_data["sonnet_failure_rate"]
+        gpt_cross_fr = gpt_data["crossvendor_failure_rate"]
+        opus_cross_fr = opus_data["crossvendor_failure_rate"]
 
         sonnet_ratio = (
             opus_sonnet_fr / gpt_sonnet_fr if gpt_sonnet_fr > 0 else float("inf")
@@ -283,7 +567,7 @@ def compare(
                 "ratio": cross_ratio,
             },
             "ratio_change": f"{sonnet_ratio:.1f}x → {cross_ratio:.1f}x",
-            "effect_size_h": compute_cohens_h(gpt_cross_fr, opus_cross_fr),
+            "effect_size_h": abs(phi_map[opus_model] - phi_map[gpt_model]),
         }
 
     return results
@@ -357,60 +641,74 @@ def save_report(results: dict, output_dir: Path | None = None) -> None:
 
     # JSON
     json_path = target_dir / "comparison_summary.json"
-    with open(json_path, "w") as f:
-        json.dump(results, f, indent=2)
-    logger.info("JSON saved: %s", json_path)
+    if orjson is not None:
+        json_bytes = orjson.dumps(
+            results, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        )
+    else:
+        json_bytes = json.dumps(results, indent=2).encode()
 
-    # Markdown
+    # Markdown — streamed into one growable buffer rather than a line list,
+    # which avoids re-traversing thousands of small strings on big reports.
     md_path = target_dir / "comparison_report.md"
-    lines = [
-        "# MSTS Cross-Vendor Regrade — Comparison Report\n",
-        f"Matched trajectories: {results['n_matched']}\n",
-    ]
+    buf = io.StringIO()
+
+    def w(line: str) -> None:
+        buf.write(line)
+        buf.write("\n")
+
+    w("# MSTS Cross-Vendor Regrade — Comparison Report\n")
+    w(f"Matched trajectories: {results['n_matched']}\n")
 
     for model, data in sorted(results["models"].items()):
-        lines.append(f"\n## {model}\n")
-        lines.append(f"- Judge: {data['judge_model']}")
-        lines.append(f"- N: {data['n']}")
-        lines.append(f"- Sonnet 4.5 failure rate: {data['sonnet_failure_rate']:.3%}")
-        lines.append(
-            f"- Cross-vendor failure rate: {data['crossvendor_failure_rate']:.3%}"
-        )
+        w(f"\n## {model}\n")
+        w(f"- Judge: {data['judge_model']}")
+        w(f"- N: {data['n']}")
+        w(f"- Sonnet 4.5 failure rate: {data['sonnet_failure_rate']:.3%}")
+        w(f"- Cross-vendor failure rate: {data['crossvendor_failure_rate']:.3%}")
         agr = data["agreement"]
-        lines.append(f"- Agreement rate: {agr['agreement_rate']:.1%}")
-        lines.append(f"- Cohen's κ: {agr['cohens_kappa']:.3f}\n")
+        w(f"- Agreement rate: {agr['agreement_rate']:.1%}")
+        w(f"- Cohen's κ: {agr['cohens_kappa']:.3f}\n")
 
-        lines.append("| Condition | N | Sonnet FR | Cross FR | Class A |")
-        lines.append("|-----------|---|-----------|----------|---------|")
+        w("| Condition | N | Sonnet FR | Cross FR | Class A |")
+        w("|-----------|---|-----------|----------|---------|")
         for cond, cdata in sorted(data["conditions"].items()):
-            lines.append(
+            w(
                 f"| {cond} | {cdata['n']} | "
                 f"{cdata['sonnet_failure_rate']:.1%} | "
                 f"{cdata['crossvendor_failure_rate']:.1%} | "
                 f"{cdata['classA']} |"
             )
-        lines.append("")
+        w("")
 
     if "ratio_analysis" in results:
         ra = results["ratio_analysis"]
-        lines.append("\n## 80x Ratio Analysis\n")
+        w("\n## 80x Ratio Analysis\n")
         s = ra["sonnet_judge"]
         c = ra["crossvendor_judge"]
-        lines.append("| Metric | Sonnet 4.5 Judge | Cross-Vendor Judge |")
-        lines.append("|--------|------------------|--------------------|")
-        lines.append(
+        w("| Metric | Sonnet 4.5 Judge | Cross-Vendor Judge |")
+        w("|--------|------------------|--------------------|")
+        w(
             f"| GPT failure rate | {s['gpt_failure_rate']:.3%} | {c['gpt_failure_rate']:.3%} |"
         )
-        lines.append(
+        w(
             f"| Opus failure rate | {s['opus_failure_rate']:.3%} | {c['opus_failure_rate']:.3%} |"
         )
-        lines.append(f"| Ratio | {s['ratio']:.1f}x | {c['ratio']:.1f}x |")
-        lines.append(f"\nRatio change: **{ra['ratio_change']}**")
-        lines.append(f"\nEffect size (Cohen's h): {ra['effect_size_h']:.3f}")
-
-    with open(md_path, "w") as f:
-        f.write("\n".join(lines) + "\n")
-    logger.info("Markdown saved: %s", md_path)
+        w(f"| Ratio | {s['ratio']:.1f}x | {c['ratio']:.1f}x |")
+        w(f"\nRatio change: **{ra['ratio_change']}**")
+        w(f"\nEffect size (Cohen's h): {ra['effect_size_h']:.3f}")
+
+    md_bytes = buf.getvalue().encode()
+
+    # The two files are independent; overlap the write syscalls.
+    with ThreadPoolExecutor(max_workers=2) as ex:
+        writes = [
+            (json_path, ex.submit(json_path.write_bytes, json_bytes)),
+            (md_path, ex.submit(md_path.write_bytes, md_bytes)),
+        ]
+        for path, future in writes:
+            future.result()
+            logger.info("Saved: %s", path)
 
 
 def main():
@@ -13,12 +13,20 @@ Usage:
 """
 
 import argparse
+import os
 import sys
-from collections import defaultdict
+from collections import Counter, defaultdict
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 import yaml
 
+try:  # libyaml-backed loader — 3-10x faster than the pure-Python parser
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 REPO_ROOT = Path(__file__).resolve().parent.parent
 SCENARIOS_DIR = REPO_ROOT / "src" / "lostbench" / "scenarios"
 INDEX_PATH = REPO_ROOT / "results" / "index.yaml"
@@ -122,24 +130,44 @@ def _display_model(model_id: str) -> str:
     return MODEL_DISPLAY.get(model_id, model_id)
 
 
-def _load_all_scenarios(scenarios_dir: Path) -> list[dict]:
-    """Load all scenario YAML files across all corpus directories."""
-    scenarios = []
+def _parse_scenario_file(job: tuple[str, str]) -> tuple[str, dict | None]:
+    """Parse one scenario YAML — module-level so pool workers can import it."""
+    corpus_name, path_str = job
+    try:
+        with open(path_str) as f:
+            scenario = yaml.load(f, Loader=_YamlLoader)
+    except (yaml.YAMLError, OSError):
+        return corpus_name, None
+    return corpus_name, scenario if isinstance(scenario, dict) else None
+
+
+def _iter_scenarios(scenarios_dir: Path) -> Iterator[dict]:
+    """Yield scenario dicts across all corpus directories, one at a time.
+
+    Files are independent and parse CPU dominates, so parsing is fanned
+    out to a process pool; results stream back lazily, so the full
+    scenario list is never materialized.
+    """
+    jobs: list[tuple[str, str]] = []
     for corpus_name, subdir in CORPUS_DIRS.items():
         corpus_dir = scenarios_dir / subdir
         if not corpus_dir.exists():
             continue
-        for yaml_path in sorted(corpus_dir.glob("*.yaml")):
-            try:
-                with open(yaml_path) as f:
-                    scenario = yaml.safe_load(f)
-                if isinstance(scenario, dict):
-                    scenario.setdefault("corpus", corpus_name)
-                    scenario["_source_dir"] = corpus_name
-                    scenarios.append(scenario)
-            except (yaml.YAMLError, OSError):
+        jobs.extend(
+            (corpus_name, str(yaml_path))
+            for yaml_path in sorted(corpus_dir.glob("*.yaml"))
+        )
+
+    if not jobs:
+        return
+
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as ex:
+        for corpus_name, scenario in ex.map(_parse_scenario_file, jobs, chunksize=16):
+            if scenario is None:
                 continue
-    return scenarios
+            scenario.setdefault("corpus", corpus_name)
+            scenario["_source_dir"] = corpus_name
+            yield scenario
 
 
 def _load_index(index_path: Path) -> list[dict]:
@@ -151,24 +179,43 @@ def _load_index(index_path: Path) -> list[dict]:
     return data.get("experiments", [])
 
 
-def _get_domain(condition: str) -> str:
-    """Map a condition to its medical domain."""
-    return DOMAIN_MAP.get(condition, "Uncategorized")
-
-
-def generate_condition_families(scenarios: list[dict]) -> str:
-    """Section 1: Condition families vs. corpora."""
-    # Group conditions by domain, track which corpora they appear in
-    domain_corpora: dict[str, dict[str, list[str]]] = defaultdict(
-        lambda: defaultdict(list)
-    )
+# Computed once at import — generate_condition_families previously rebuilt
+# this set on every call.
+_ALL_DOMAINS = frozenset(DOMAIN_MAP.values())
+
+
+def _aggregate(
+    scenarios: Iterable[dict],
+) -> tuple[Counter[tuple[str, str]], Counter[tuple[str, str]], int]:
+    """Single-pass aggregation feeding Sections 1 and 2.
+
+    Sections 1 and 2 need different groupings of the same scenarios;
+    computing both in one traversal (over a lazy iterable) avoids both
+    a second walk and holding every scenario in memory at once. Both
+    groupings are flat Counters keyed by (group, corpus) tuples — the
+    counting itself happens in Counter's C fast path instead of nested
+    defaultdict lookups, and nothing per-scenario is retained.
+    Returns (domain_corpus_counts, pressure_corpus_counts, scenario_count).
+    """
+    domain_counts: Counter[tuple[str, str]] = Counter()
+    pressure_counts: Counter[tuple[str, str]] = Counter()
+    domain_of = DOMAIN_MAP.get
+    count = 0
     for s in scenarios:
-        condition = s.get("condition", "unknown")
-        corpus = s.get("_source_dir", "unknown")
-        sid = s.get("id", "?")
-        domain = _get_domain(condition)
-        domain_corpora[domain][corpus].append(f"{sid} ({condition})")
-
+        count += 1
+        get = s.get
+        corpus = get("_source_dir", "unknown")
+        domain_counts[
+            (domain_of(get("condition", "unknown"), "Uncategorized"), corpus)
+        ] += 1
+        pressure_counts.update(
+            (p.get("type", "unknown"), corpus) for p in get("pressure", [])
+        )
+    return domain_counts, pressure_counts, count
+
+
+def generate_condition_families(domain_counts: Counter[tuple[str, str]]) -> str:
+    """Section 1: Condition families vs. corpora (renders _aggregate output)."""
     all_corpora = sorted(CORPUS_DIRS.keys())
     lines = [
         "## Condition Families × Corpora\n",
@@ -180,20 +227,18 @@ def generate_condition_families(scenarios: list[dict]) -> str:
     lines.append(header)
     lines.append(sep)
 
-    for domain in sorted(domain_corpora.keys()):
-        corpus_map = domain_corpora[domain]
+    covered_domains = {domain for domain, _ in domain_counts}
+    for domain in sorted(covered_domains):
         cells = []
         total = 0
         for corpus in all_corpora:
-            count = len(corpus_map.get(corpus, []))
+            count = domain_counts.get((domain, corpus), 0)
             total += count
             cells.append(str(count) if count > 0 else "-")
         lines.append(f"| {domain} | " + " | ".join(cells) + f" | {total} |")
 
     # Flag missing domains
-    all_domains = set(DOMAIN_MAP.values())
-    covered_domains = set(domain_corpora.keys())
-    missing = all_domains - covered_domains
+    missing = _ALL_DOMAINS - covered_domains
     if missing:
         lines.append(f"\n**Domains with no scenarios:** {', '.join(sorted(missing))}")
 
@@ -201,16 +246,8 @@ def generate_condition_families(scenarios: list[dict]) -> str:
     return "\n".join(lines)
 
 
-def generate_pressure_coverage(scenarios: list[dict]) -> str:
-    """Section 2: Pressure strategy coverage."""
-    # Extract pressure types per corpus
-    pressure_corpora: dict[str, dict[str, int]] = defaultdict(lambda: defaultdict(int))
-    for s in scenarios:
-        corpus = s.get("_source_dir", "unknown")
-        for p in s.get("pressure", []):
-            ptype = p.get("type", "unknown")
-            pressure_corpora[ptype][corpus] += 1
-
+def generate_pressure_coverage(pressure_counts: Counter[tuple[str, str]]) -> str:
+    """Section 2: Pressure strategy coverage (renders _aggregate output)."""
     all_corpora = sorted(CORPUS_DIRS.keys())
     lines = [
         "## Pressure Strategy × Corpus\n",
@@ -222,12 +259,11 @@ def generate_pressure_coverage(scenarios: list[dict]) -> str:
     lines.append(header)
     lines.append(sep)
 
-    for ptype in sorted(pressure_corpora.keys()):
-        corpus_map = pressure_corpora[ptype]
+    for ptype in sorted({p for p, _ in pressure_counts}):
         cells = []
         total = 0
         for corpus in all_corpora:
-            count = corpus_map.get(corpus, 0)
+            count = pressure_counts.get((ptype, corpus), 0)
             total += count
             cells.append(str(count) if count > 0 else "-")
         lines.append(f"| `{ptype}` | " + " | ".join(cells) + f" | {total} |")
@@ -246,6 +282,7 @@ def generate_vector_model_coverage(experiments: list[dict]) -> str:
         coverage[corpus][model] += 1
 
     all_models = sorted({m for c in coverage.values() for m in c})
+    display_models = [_display_model(m) for m in all_models]
     all_corpora = sorted(coverage.keys())
 
     lines = [
@@ -253,7 +290,7 @@ def generate_vector_model_coverage(experiments: list[dict]) -> str:
         "Number of evaluation runs per (corpus, model) combination.\n",
     ]
 
-    header = "| Corpus | " + " | ".join(_display_model(m) for m in all_models) + " |"
+    header = "| Corpus | " + " | ".join(display_models) + " |"
     sep = "|--------" + "|-------" * len(all_models) + "|"
     lines.append(header)
     lines.append(sep)
@@ -261,13 +298,13 @@ def generate_vector_model_coverage(experiments: list[dict]) -> str:
     gaps = []
     for corpus in all_corpora:
         cells = []
-        for model in all_models:
+        for model, display in zip(all_models, display_models, strict=True):
             count = coverage[corpus].get(model, 0)
             if count > 0:
                 cells.append(str(count))
             else:
                 cells.append("**GAP**")
-                gaps.append((corpus, _display_model(model)))
+                gaps.append((corpus, display))
         lines.append(f"| {corpus} | " + " | ".join(cells) + " |")
 
     if gaps:
@@ -283,15 +320,17 @@ def generate_coverage_matrix(
     scenarios_dir: Path, index_path: Path, output: Path | None = None
 ) -> str:
     """Generate the full coverage matrix markdown."""
-    scenarios = _load_all_scenarios(scenarios_dir)
     experiments = _load_index(index_path)
+    domain_counts, pressure_counts, n_scenarios = _aggregate(
+        _iter_scenarios(scenarios_dir)
+    )
 
     sections = [
         "# LostBench Coverage Matrix\n",
-        f"Generated from {len(scenarios)} scenarios across {len(CORPUS_DIRS)} corpora "
+        f"Generated from {n_scenarios} scenarios across {len(CORPUS_DIRS)} corpora "
         f"and {len(experiments)} experiment runs.\n",
-        generate_condition_families(scenarios),
-        generate_pressure_coverage(scenarios),
+        generate_condition_families(domain_counts),
+        generate_pressure_coverage(pressure_counts),
         generate_vector_model_coverage(experiments),
     ]
 
@@ -305,7 +344,7 @@ def generate_coverage_matrix(
     return md
 
 
-def main():
+def main() -> None:
     parser = argparse.ArgumentParser(
         description="Generate LostBench coverage matrix from scenarios and results"
     )
@@ -13,13 +13,23 @@ Usage:
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
 import logging
+import os
+import re
 import sys
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import yaml
 
+try:  # libyaml-backed loader — 3-10x faster than the pure-Python parser
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 logger = logging.getLogger(__name__)
 
 # Ensure src/ is importable
@@ -41,6 +51,9 @@ SEEDS_MINED_DIR = REPO_ROOT / "seeds_mined"
 SEEDS_GENERATED_DIR = REPO_ROOT / "seeds_generated"
 SEEDS_RETIRED_DIR = REPO_ROOT / "seeds_retired"
 CACHE_PATH = REPO_ROOT / ".coverage_cache.json"
+CORPUS_CACHE_PATH = REPO_ROOT / ".coverage_corpus_cache.json"
+# Prebuilt corpus artifact — regenerate with scripts/build_conditions_cache.py
+CONDITIONS_JSON = REPO_ROOT / "src" / "lostbench" / "_data" / "conditions.json"
 
 
 def _load_openem_conditions() -> list[dict]:
@@ -58,8 +71,94 @@ def _load_openem_conditions() -> list[dict]:
                 conditions.append(entry)
         return conditions
     except ImportError:
-        logger.info("openem not installed — falling back to corpus directory scan")
-        return _scan_openem_conditions()
+        pass
+
+    # Prebuilt artifact next: json.load is C-backed and skips YAML
+    # parsing entirely (see scripts/build_conditions_cache.py).
+    if CONDITIONS_JSON.exists():
+        try:
+            with open(CONDITIONS_JSON) as f:
+                conditions = json.load(f)["conditions"]
+            logger.info(
+                "Loaded %d conditions from %s", len(conditions), CONDITIONS_JSON
+            )
+            return conditions
+        except Exception as e:
+            logger.warning("Bad conditions artifact %s: %s", CONDITIONS_JSON, e)
+
+    logger.info("openem not installed — falling back to corpus directory scan")
+    return _scan_openem_conditions()
+
+
+# Reads release the GIL and libyaml parses in C, so threads give
+# near-linear speedup on these scans up to disk throughput.
+_SCAN_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+
+def _scan_files(directory: Path, suffix: str) -> list[Path]:
+    """Sorted files with the given suffix, via os.scandir.
+
+    Cheaper than Path.glob for flat directories: DirEntry.is_file reads
+    d_type from the directory listing, so no per-entry stat or fnmatch.
+    Returns [] when the directory doesn't exist.
+    """
+    try:
+        with os.scandir(directory) as it:
+            return sorted(
+                Path(entry.path)
+                for entry in it
+                if entry.name.endswith(suffix) and entry.is_file(follow_symlinks=False)
+            )
+    except OSError:
+        return []
+
+
+def _walk_files(directory: Path, suffix: str) -> list[Path]:
+    """Like _scan_files but recursive (os.walk is scandir-based)."""
+    if not directory.exists():
+        return []
+    return sorted(
+        Path(root) / name
+        for root, _dirs, names in os.walk(directory)
+        for name in names
+        if name.endswith(suffix)
+    )
+
+
+# Frontmatter fits in the first page or two; condition doc bodies can be
+# long, so reading them in full just to slice the header is wasted I/O.
+_FRONTMATTER_READ = 8192
+
+
+def _parse_condition_file(path: Path) -> dict | None:
+    """Parse one condition .md's YAML frontmatter. None on any failure."""
+    try:
+        # Read only the head of the file — the closing --- is almost
+        # always within the first 8 KiB. Fall back to the full file for
+        # oversized frontmatter.
+        with open(path, "rb") as f:
+            buf = f.read(_FRONTMATTER_READ)
+            if not buf.startswith(b"---"):
+                return None
+            end = buf.find(b"---", 3)
+            if end == -1 and len(buf) == _FRONTMATTER_READ:
+                buf += f.read()
+                end = buf.find(b"---", 3)
+        if end == -1:
+            logger.warning("Failed to load %s: unterminated frontmatter", path.name)
+            return None
+        frontmatter = buf[3:end].decode().strip()
+        data = yaml.load(frontmatter, Loader=_YamlLoader)
+        if not isinstance(data, dict):
+            return None
+        data.setdefault("condition_id", data.get("id", path.stem))
+        # Normalize category field name
+        if "category" in data and "abem_category" not in data:
+            data["abem_category"] = data["category"]
+        return data
+    except Exception as e:
+        logger.warning("Failed to load %s: %s", path.name, e)
+        return None
 
 
 def _scan_openem_conditions() -> list[dict]:
@@ -82,34 +181,25 @@ def _scan_openem_conditions() -> list[dict]:
     conditions = []
 
     # Try markdown frontmatter format first
+    md_paths: list[Path] = []
     for corpus_dir in corpus_dirs:
         if not corpus_dir.exists():
             continue
         found_any = True
-        for path in sorted(corpus_dir.glob("*.md")):
-            try:
-                text = path.read_text()
-                if not text.startswith("---"):
-                    continue
-                # Extract YAML frontmatter between --- markers
-                end = text.index("---", 3)
-                frontmatter = text[3:end].strip()
-                data = yaml.safe_load(frontmatter)
-                if isinstance(data, dict):
-                    data.setdefault("condition_id", data.get("id", path.stem))
-                    # Normalize category field name
-                    if "category" in data and "abem_category" not in data:
-                        data["abem_category"] = data["category"]
-                    conditions.append(data)
-            except Exception as e:
-                logger.warning("Failed to load %s: %s", path.name, e)
+        md_paths.extend(_scan_files(corpus_dir, ".md"))
+    if md_paths:
+        with ThreadPoolExecutor(max_workers=_SCAN_WORKERS) as ex:
+            conditions = [
+                data for data in ex.map(_parse_condition_file, md_paths) if data
+            ]
 
     # Fallback: try YAML directory
     if not found_any and yaml_dir.exists():
-        for path in sorted(yaml_dir.glob("*.yaml")):
+        from lostbench._yaml_cache import load_yaml
+
+        for path in _scan_files(yaml_dir, ".yaml"):
             try:
-                with open(path) as f:
-                    data = yaml.safe_load(f)
+                data = load_yaml(path)
                 if isinstance(data, dict):
                     data.setdefault("condition_id", path.stem)
                     conditions.append(data)
@@ -122,48 +212,199 @@ def _scan_openem_conditions() -> list[dict]:
     return conditions
 
 
+# Top-level `condition:` line in a scenario/seed YAML. Matching this
+# directly skips a full YAML parse when the only field needed is the
+# condition id.
+_COND_RE = re.compile(r"^condition:\s*[\"']?([\w\-/]+)", re.MULTILINE)
+
+
+def _read_condition_field(path: Path) -> str | None:
+    """Extract the `condition` field from a scenario/seed YAML.
+
+    Fast path: regex over the raw text. Falls back to a full YAML parse
+    for files where the field isn't a plain top-level scalar. Returns
+    None when the field is absent or the file is unreadable.
+    """
+    try:
+        text = path.read_text()
+    except OSError:
+        return None
+    m = _COND_RE.search(text)
+    if m:
+        return m.group(1)
+    try:
+        data = yaml.load(text, Loader=_YamlLoader)
+    except yaml.YAMLError:
+        return None
+    if isinstance(data, dict):
+        cond = data.get("condition")
+        if isinstance(cond, str):
+            return cond
+    return None
+
+
 def _load_covered_conditions() -> dict[str, str]:
     """Load condition IDs from all scenario and seed directories.
 
+    Keys are normalized to underscore form (hyphens -> underscores) so
+    build_coverage_report can match with a single lookup.
+
     Returns:
         Dict mapping condition_id -> coverage_source ("scenario" or "seed").
     """
+    scenario_paths = [
+        path
+        for scenario_dir in SCENARIO_DIRS
+        for path in _scan_files(scenario_dir, ".yaml")
+    ]
+    # Seeds (mined, generated, retired) — recurse into subdirs
+    seed_paths = [
+        path
+        for seeds_dir in (SEEDS_MINED_DIR, SEEDS_GENERATED_DIR, SEEDS_RETIRED_DIR)
+        for path in _walk_files(seeds_dir, ".yaml")
+        if not path.name.startswith("_")
+    ]
+
     covered: dict[str, str] = {}
+    all_paths = scenario_paths + seed_paths
+    if not all_paths:
+        return covered
 
-    # Scenarios
-    for scenario_dir in SCENARIO_DIRS:
-        if not scenario_dir.exists():
-            continue
-        for path in scenario_dir.glob("*.yaml"):
-            try:
-                with open(path) as f:
-                    data = yaml.safe_load(f)
-                if isinstance(data, dict) and "condition" in data:
-                    cond = data["condition"]
-                    covered[cond] = "covered_scenario"
-            except Exception:
-                continue
+    sources = ["covered_scenario"] * len(scenario_paths) + ["covered_seed"] * len(
+        seed_paths
+    )
 
-    # Seeds (mined, generated, retired) — use **/*.yaml to recurse into subdirs
-    for seeds_dir in [SEEDS_MINED_DIR, SEEDS_GENERATED_DIR, SEEDS_RETIRED_DIR]:
-        if not seeds_dir.exists():
-            continue
-        for path in seeds_dir.glob("**/*.yaml"):
-            if path.name.startswith("_"):
-                continue
-            try:
-                with open(path) as f:
-                    data = yaml.safe_load(f)
-                if isinstance(data, dict) and "condition" in data:
-                    cond = data["condition"]
-                    if cond not in covered:
-                        covered[cond] = "covered_seed"
-            except Exception:
+    # One walk over both groups; scenarios come first and overwrite, so
+    # they take precedence over seeds regardless of seed ordering.
+    with ThreadPoolExecutor(max_workers=_SCAN_WORKERS) as ex:
+        conds = ex.map(_read_condition_field, all_paths)
+        for cond, source in zip(conds, sources, strict=True):
+            if cond is None:
                 continue
+            key = cond.replace("-", "_")
+            if source == "covered_scenario":
+                covered[key] = source
+            else:
+                covered.setdefault(key, source)
 
     return covered
 
 
+def _watched_scans() -> list[tuple[Path, str, bool]]:
+    """(directory, suffix, recursive) for every input feeding the report."""
+    base = Path.home() / "openem-corpus"
+    scans: list[tuple[Path, str, bool]] = [
+        (base / "corpus" / "tier1" / "conditions", ".md", False),
+        (base / "corpus" / "tier2" / "conditions", ".md", False),
+        (base / "data" / "conditions", ".yaml", False),
+    ]
+    scans += [(d, ".yaml", False) for d in SCENARIO_DIRS]
+    scans += [
+        (d, ".yaml", True)
+        for d in (SEEDS_MINED_DIR, SEEDS_GENERATED_DIR, SEEDS_RETIRED_DIR)
+    ]
+    return scans
+
+
+def _corpus_fingerprint() -> str | None:
+    """Stat-level fingerprint of every file feeding the corpus scans.
+
+    Hashes (path, mtime_ns, size) for all OpenEM condition files and all
+    scenario/seed YAMLs — a single stat pass, no file reads. Returns None
+    when no corpus files exist, which disables caching.
+    """
+    h = hashlib.blake2b()
+    n_files = 0
+    for directory, suffix, recursive in _watched_scans():
+        lister = _walk_files if recursive else _scan_files
+        for path in lister(directory, suffix):
+            st = path.stat()
+            h.update(f"{path}\0{st.st_mtime_ns}\0{st.st_size}\n".encode())
+            n_files += 1
+    return h.hexdigest() if n_files else None
+
+
+def _max_input_mtime() -> int | None:
+    """Newest mtime_ns across all watched inputs, or None when empty."""
+    newest: int | None = None
+    for directory, suffix, recursive in _watched_scans():
+        lister = _walk_files if recursive else _scan_files
+        for path in lister(directory, suffix):
+            mtime = path.stat().st_mtime_ns
+            if newest is None or mtime > newest:
+                newest = mtime
+    return newest
+
+
+def _load_report_cached() -> dict | None:
+    """Return the cached report when no input file postdates it.
+
+    --cache writes the built report to CACHE_PATH; when that file is
+    newer than every corpus, scenario, and seed file, a re-run that only
+    wants a different --format can serve it straight from disk. Any
+    doubt (no cache, newer inputs, unreadable JSON) rebuilds.
+    """
+    try:
+        cache_mtime = CACHE_PATH.stat().st_mtime_ns
+    except OSError:
+        return None
+    newest = _max_input_mtime()
+    if newest is None or newest >= cache_mtime:
+        return None
+    try:
+        with open(CACHE_PATH) as f:
+            report = json.load(f)
+    except Exception:
+        return None  # corrupt cache — rebuild
+    if not isinstance(report, dict) or "summary" not in report:
+        return None
+    logger.debug("Report loaded from cache: %s", CACHE_PATH)
+    return report
+
+
+def _load_corpus_cached() -> tuple[list[dict], dict[str, str]]:
+    """Load (openem_conditions, covered) via the sidecar cache.
+
+    Re-parsing thousands of condition and scenario files on every
+    invocation is pure waste for a static corpus; the parsed results are
+    kept in CORPUS_CACHE_PATH keyed by _corpus_fingerprint, so unchanged
+    corpora skip straight to json.load. Any mismatch or corrupt cache
+    falls back to a full re-scan and rewrites the sidecar.
+    """
+    fingerprint = _corpus_fingerprint()
+    if fingerprint is not None and CORPUS_CACHE_PATH.exists():
+        try:
+            with open(CORPUS_CACHE_PATH) as f:
+                payload = json.load(f)
+            if payload.get("fingerprint") == fingerprint:
+                logger.debug("Corpus loaded from cache: %s", CORPUS_CACHE_PATH)
+                return payload["conditions"], payload["covered"]
+        except Exception:
+            pass  # corrupt cache — re-scan below
+
+    conditions = _load_openem_conditions()
+    covered = _load_covered_conditions()
+
+    if fingerprint is not None:
+        tmp_path = CORPUS_CACHE_PATH.with_suffix(".json.tmp")
+        try:
+            with open(tmp_path, "w") as f:
+                json.dump(
+                    {
+                        "fingerprint": fingerprint,
+                        "conditions": conditions,
+                        "covered": covered,
+                    },
+                    f,
+                    default=str,
+                )
+            os.replace(tmp_path, CORPUS_CACHE_PATH)
+        except Exception:
+            pass  # cache is an optimization; never fail the report over it
+
+    return conditions, covered
+
+
 def _assign_priority(
     condition: dict,
     coverage_status: str,
@@ -192,13 +433,20 @@ def build_coverage_report(
         by_priority (dict).
     """
     if openem_conditions is None:
-        openem_conditions = _load_openem_conditions()
-
-    covered = _load_covered_conditions()
+        # The default path reads the whole corpus — serve it from the
+        # sidecar cache. Callers supplying their own conditions (tests,
+        # programmatic use) always get a fresh coverage scan.
+        openem_conditions, covered = _load_corpus_cached()
+    else:
+        covered = _load_covered_conditions()
 
     conditions_report: list[dict] = []
-    by_category: dict[str, dict] = {}
-    by_priority: dict[str, int] = {"P0": 0, "P1": 0, "P2": 0}
+    by_category: defaultdict[str, dict] = defaultdict(
+        lambda: {"total": 0, "covered": 0, "uncovered": 0}
+    )
+    # Seeded with zeros so all three tiers appear in the report even
+    # when empty.
+    by_priority: Counter[str] = Counter({"P0": 0, "P1": 0, "P2": 0})
 
     for cond in openem_conditions:
         cid = cond.get("condition_id", "unknown")
@@ -207,9 +455,8 @@ def build_coverage_report(
         tth = cond.get("time_to_harm", "")
         has_confusion = bool(cond.get("confusion_pairs"))
 
-        # Normalize condition_id for matching (hyphens → underscores)
-        cid_normalized = cid.replace("-", "_")
-        coverage_status = covered.get(cid_normalized, covered.get(cid, "uncovered"))
+        # Both sides are normalized to underscores, so one lookup suffices
+        coverage_status = covered.get(cid.replace("-", "_"), "uncovered")
 
         priority = _assign_priority(cond, coverage_status)
 
@@ -225,8 +472,6 @@ def build_coverage_report(
         conditions_report.append(entry)
 
         # Category stats
-        if category not in by_category:
-            by_category[category] = {"total": 0, "covered": 0, "uncovered": 0}
         by_category[category]["total"] += 1
         if coverage_status == "uncovered":
             by_category[category]["uncovered"] += 1
@@ -254,8 +499,8 @@ def build_coverage_report(
     return {
         "conditions": conditions_report,
         "summary": summary,
-        "by_category": by_category,
-        "by_priority": by_priority,
+        "by_category": dict(by_category),
+        "by_priority": dict(by_priority),
     }
 
 
@@ -325,6 +570,11 @@ def main() -> None:
         action="store_true",
         help="Write JSON output to .coverage_cache.json",
     )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Rebuild even if .coverage_cache.json is up to date",
+    )
     parser.add_argument("-v", "--verbose", action="store_true")
 
     args = parser.parse_args()
@@ -335,7 +585,9 @@ def main() -> None:
         stream=sys.stderr,
     )
 
-    report = build_coverage_report()
+    report = None if args.force else _load_report_cached()
+    if report is None:
+        report = build_coverage_report()
 
     if args.format == "json":
         output = json.dumps(report, indent=2)
@@ -346,8 +598,10 @@ def main() -> None:
         print(format_text(report))
 
     if args.cache:
+        # Compact form — the cache is read by tools, not humans, and
+        # indented JSON roughly doubles the bytes written.
         with open(CACHE_PATH, "w") as f:
-            json.dump(report, f, indent=2)
+            json.dump(report, f, separators=(",", ":"))
         print(f"\nCache written to {CACHE_PATH}", file=sys.stderr)
 
 
@@ -16,21 +16,28 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+import functools
 import json
 import logging
+import os
 import sys
 import time
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-import yaml
+try:  # optional, ~2-5x faster than stdlib json for dict dumps
+    import orjson
+except ImportError:
+    orjson = None
 
-from lostbench.cache import ResponseCache
-from lostbench.challenge import ChallengeResult, run_challenge
-from lostbench.msiw.wrapper import MSIW_SYSTEM_PREAMBLE
-from lostbench.providers import get_provider
-from lostbench.providers.cached import CachedProvider
+# yaml and the lostbench stack are imported lazily inside the functions
+# that need them so --help and argument errors don't pay their import
+# cost.
+if TYPE_CHECKING:
+    from lostbench.challenge import ChallengeResult
+    from lostbench.providers.cached import CachedProvider
 
 logger = logging.getLogger("eval_gen_seeds")
 
@@ -49,41 +56,83 @@ DEFAULT_SEEDS_DIR = Path(__file__).parent.parent / "seeds_generated"
 DEFAULT_OUTPUT_BASE = Path(__file__).parent.parent / "results" / "seeds-gen-eval"
 
 
-def load_seeds(seeds_dir: Path) -> list[dict]:
-    """Load generated seed YAMLs (gen-*.yaml or cyc-*.yaml)."""
+async def load_seeds(seeds_dir: Path) -> list[dict]:
+    """Load generated seed YAMLs (gen-*.yaml or cyc-*.yaml).
+
+    Each file parses in a worker thread so loading overlaps the
+    provider warmup running on the same event loop.
+    """
+    from lostbench._yaml_cache import load_yaml
+
     if not seeds_dir.exists():
         logger.error("Seeds directory not found: %s", seeds_dir)
         sys.exit(1)
-    scenarios = []
-    for path in sorted(seeds_dir.glob("*.yaml")):
-        if path.name.startswith("_"):
-            continue
-        with open(path) as f:
-            scenarios.append(yaml.safe_load(f))
-    if not scenarios:
+    paths = [p for p in sorted(seeds_dir.glob("*.yaml")) if not p.name.startswith("_")]
+    if not paths:
         logger.error("No seed YAML files found in %s", seeds_dir)
         sys.exit(1)
-    return scenarios
+
+    sem = asyncio.Semaphore(8)
+
+    async def _load(path: Path) -> dict:
+        async with sem:
+            return await asyncio.to_thread(load_yaml, path)
+
+    return list(await asyncio.gather(*(_load(p) for p in paths)))
+
+
+# Compact the append log into checkpoint.json every N completions.
+_COMPACT_EVERY = 50
 
 
 def load_checkpoint(checkpoint_file: Path) -> dict:
+    """Union of the compacted JSON and any uncompacted log lines."""
+    completed: set[str] = set()
     if checkpoint_file.exists():
         with open(checkpoint_file) as f:
-            data = json.load(f)
-        return {"completed": set(data.get("completed", []))}
-    return {"completed": set()}
+            completed.update(json.load(f).get("completed", []))
+    log_file = checkpoint_file.with_suffix(".log")
+    if log_file.exists():
+        with open(log_file) as f:
+            completed.update(line.strip() for line in f if line.strip())
+    return {"completed": completed}
+
+
+def append_checkpoint(state: dict, key: str, checkpoint_file: Path) -> None:
+    """Record one completion in the append-only checkpoint log.
+
+    Rewriting the full sorted JSON after every challenge is O(N) per
+    write as the completed set grows; appending one fsynced line is
+    O(1). The log folds into checkpoint.json every _COMPACT_EVERY
+    appends and at the end of the run.
+    """
+    log_file = checkpoint_file.with_suffix(".log")
+    log_file.parent.mkdir(parents=True, exist_ok=True)
+    with open(log_file, "a") as f:
+        f.write(key + "\n")
+        f.flush()
+        os.fsync(f.fileno())
+    state["appends"] = state.get("appends", 0) + 1
+    if state["appends"] % _COMPACT_EVERY == 0:
+        save_checkpoint(state, checkpoint_file)
 
 
 def save_checkpoint(state: dict, checkpoint_file: Path) -> None:
+    """Compact the full completed set into checkpoint.json."""
     checkpoint_file.parent.mkdir(parents=True, exist_ok=True)
     with open(checkpoint_file, "w") as f:
         json.dump({"completed": sorted(state["completed"])}, f, indent=2)
+    log_file = checkpoint_file.with_suffix(".log")
+    if log_file.exists():
+        log_file.unlink()
 
 
+@functools.cache
 def checkpoint_key(model: str, condition: str, seed_id: str) -> str:
     return f"{model}|{condition}|{seed_id}"
 
 
+@functools.cache
 def model_safe(model: str) -> str:
     return model.replace("/", "-").replace(" ", "_")
 
@@ -97,6 +146,9 @@ async def run_one_challenge(
     output_dir: Path,
     temperature: float = 0.0,
 ) -> ChallengeResult:
+    from lostbench.challenge import run_challenge
+    from lostbench.msiw.wrapper import MSIW_SYSTEM_PREAMBLE
+
     system_prompt = (
         MSIW_SYSTEM_PREAMBLE.strip() if condition == "preamble_only" else None
     )
@@ -114,8 +166,13 @@ async def run_one_challenge(
     msafe = model_safe(model)
     filename = f"challenge_{result.scenario_id}_{msafe}_{condition}.json"
     path = output_dir / filename
-    with open(path, "w") as f:
-        json.dump(result.to_dict(), f, indent=2)
+    # Transcript files run to hundreds of KB; serialize natively and
+    # write in one syscall where orjson is available.
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(result.to_dict(), option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, "w") as f:
+            json.dump(result.to_dict(), f, indent=2)
     return result
 
 
@@ -124,23 +181,34 @@ async def run_eval(
     conditions: list[str],
     n_trials: int,
     scenarios: list[dict],
+    providers: dict[str, CachedProvider],
     output_base: Path = DEFAULT_OUTPUT_BASE,
     temperature: float = 0.0,
+    concurrency_per_provider: int = 4,
 ) -> None:
     checkpoint_file = output_base / "checkpoint.json"
     state = load_checkpoint(checkpoint_file)
 
-    all_keys = set()
-    for model_cfg in models:
-        for condition in conditions:
-            for scenario in scenarios:
-                all_keys.add(
-                    checkpoint_key(model_cfg["model"], condition, scenario["id"])
-                )
-    done_keys = all_keys & state["completed"]
-    remaining_keys = all_keys - state["completed"]
-    total = len(all_keys)
-    done = len(done_keys)
+    # Every (model, condition, seed) cell; completed ones are skipped.
+    # On a cold start no keys need formatting — every cell is pending
+    # and the total is plain arithmetic.
+    total = len(models) * len(conditions) * len(scenarios)
+    cells = [
+        (model_cfg, condition, scenario)
+        for model_cfg in models
+        for condition in conditions
+        for scenario in scenarios
+    ]
+    if state["completed"]:
+        pending = [
+            (model_cfg, condition, scenario)
+            for model_cfg, condition, scenario in cells
+            if checkpoint_key(model_cfg["model"], condition, scenario["id"])
+            not in state["completed"]
+        ]
+    else:
+        pending = cells
+    done = total - len(pending)
 
     logger.info("=" * 60)
     logger.info("Generated Seeds Evaluation")
@@ -154,73 +222,68 @@ async def run_eval(
         "Total challenges: %d (%d done, %d remaining)",
         total,
         done,
-        len(remaining_keys),
+        len(pending),
     )
     logger.info("=" * 60)
 
-    if not remaining_keys:
+    if not pending:
         logger.info("All challenges already complete!")
         return
 
-    for model_cfg in models:
+    # Challenges are independent network calls; rate limits are
+    # per-provider, so each provider gets its own semaphore and shares
+    # one cached client across its models.
+    semaphores = {
+        name: asyncio.Semaphore(concurrency_per_provider) for name in providers
+    }
+    ckpt_lock = asyncio.Lock()
+
+    async def _run_entry(model_cfg: dict, condition: str, scenario: dict) -> None:
+        nonlocal done
         model = model_cfg["model"]
         provider_name = model_cfg["provider"]
-
-        cache_dir = output_base / "cache"
-        raw_provider = get_provider(provider_name)
-        cache = ResponseCache(str(cache_dir))
-        provider = CachedProvider(raw_provider, cache)
-
-        for condition in conditions:
-            out_dir = output_base / f"{model_safe(model)}_{condition}"
-
-            for scenario in scenarios:
-                seed_id = scenario["id"]
-                key = checkpoint_key(model, condition, seed_id)
-
-                if key in state["completed"]:
-                    continue
-
-                logger.info(
-                    "[%s/%s] %s — %s (%d trials)...",
-                    model,
-                    condition,
-                    seed_id,
-                    scenario.get("condition", "?"),
-                    n_trials,
-                )
-
-                t0 = time.time()
-                try:
-                    result = await run_one_challenge(
-                        scenario=scenario,
-                        provider=provider,
-                        model=model,
-                        condition=condition,
-                        n_trials=n_trials,
-                        output_dir=out_dir,
-                        temperature=temperature,
-                    )
-                    elapsed = time.time() - t0
-                    n_responses = sum(len(t.responses) for t in result.transcripts)
-                    logger.info(
-                        "  -> %d responses in %.1fs",
-                        n_responses,
-                        elapsed,
-                    )
-                except Exception as e:
-                    logger.error("  FAILED: %s — skipping, will retry on re-run", e)
-                    continue
-
-                state["completed"].add(key)
-                save_checkpoint(state, checkpoint_file)
-                done += 1
-                logger.info(
-                    "  Checkpoint: %d/%d complete (%.0f%%)",
-                    done,
-                    total,
-                    100 * done / total,
+        key = checkpoint_key(model, condition, scenario["id"])
+        async with semaphores[provider_name]:
+            logger.info(
+                "[%s/%s] %s — %s (%d trials)...",
+                model,
+                condition,
+                scenario["id"],
+                scenario.get("condition", "?"),
+                n_trials,
+            )
+            t0 = time.time()
+            try:
+                result = await run_one_challenge(
+                    scenario=scenario,
+                    provider=providers[provider_name],
+                    model=model,
+                    condition=condition,
+                    n_trials=n_trials,
+                    output_dir=output_base / f"{model_safe(model)}_{condition}",
+                    temperature=temperature,
                 )
+            except Exception as e:
+                logger.error("  FAILED: %s — skipping, will retry on re-run", e)
+                return
+            elapsed = time.time() - t0
+            n_responses = sum(len(t.responses) for t in result.transcripts)
+            logger.info("  -> %d responses in %.1fs", n_responses, elapsed)
+
+        # Serialize checkpoint updates — one writer at a time.
+        async with ckpt_lock:
+            state["completed"].add(key)
+            append_checkpoint(state, key, checkpoint_file)
+            done += 1
+            logger.info(
+                "  Checkpoint: %d/%d complete (%.0f%%)",
+                done,
+                total,
+                100 * done / total,
+            )
+
+    await asyncio.gather(*(_run_entry(*entry) for entry in pending))
+    save_checkpoint(state, checkpoint_file)
 
     logger.info("=" * 60)
     logger.info("Evaluation complete: %d/%d challenges", done, total)
@@ -263,6 +326,12 @@ def main():
         default=0.0,
         help="Sampling temperature (0.0=deterministic, 0.7=stochastic)",
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=4,
+        help="Concurrent challenges per provider (default: 4)",
+    )
     parser.add_argument(
         "--phase2-seeds",
         type=str,
@@ -292,30 +361,48 @@ def main():
     if args.condition:
         conditions = [args.condition]
 
-    scenarios = load_seeds(args.seeds_dir)
-    logger.info("Loaded %d generated seed scenarios", len(scenarios))
-
-    if args.phase2_seeds:
-        with open(args.phase2_seeds) as f:
-            screen = json.load(f)
-        disc_ids = set(screen["discriminative_seeds"])
-        scenarios = [s for s in scenarios if s["id"] in disc_ids]
-        logger.info(
-            "Phase 2: %d discriminative seeds from %s",
-            len(scenarios),
-            args.phase2_seeds,
+    async def _bootstrap() -> None:
+        from lostbench.cache import ResponseCache
+        from lostbench.providers import get_provider
+        from lostbench.providers.cached import CachedProvider
+
+        cache = ResponseCache(str(args.output_dir / "cache"))
+        provider_names = {m["provider"] for m in models}
+        providers = {
+            name: CachedProvider(get_provider(name), cache) for name in provider_names
+        }
+
+        # Seed parsing is disk-bound and warmup is network-bound —
+        # overlap them so neither delays the first challenge.
+        scenarios, _ = await asyncio.gather(
+            load_seeds(args.seeds_dir),
+            asyncio.gather(*(p.warmup() for p in providers.values())),
         )
-
-    asyncio.run(
-        run_eval(
+        logger.info("Loaded %d generated seed scenarios", len(scenarios))
+
+        if args.phase2_seeds:
+            with open(args.phase2_seeds) as f:
+                screen = json.load(f)
+            disc_ids = set(screen["discriminative_seeds"])
+            scenarios = [s for s in scenarios if s["id"] in disc_ids]
+            logger.info(
+                "Phase 2: %d discriminative seeds from %s",
+                len(scenarios),
+                args.phase2_seeds,
+            )
+
+        await run_eval(
             models,
             conditions,
             args.trials,
             scenarios,
+            providers,
             args.output_dir,
             temperature=args.temperature,
+            concurrency_per_provider=args.concurrency,
         )
-    )
+
+    asyncio.run(_bootstrap())
 
 
 if __name__ == "__main__":
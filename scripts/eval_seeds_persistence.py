@@ -14,22 +14,29 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+import functools
 import json
 import logging
+import os
 import sys
 import time
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-import yaml
+try:  # optional, ~2-5x faster than stdlib json for dict dumps
+    import orjson
+except ImportError:
+    orjson = None
 
-from lostbench.cache import ResponseCache
-from lostbench.challenge import ChallengeResult, run_challenge
-from lostbench.msiw.wrapper import MSIW_SYSTEM_PREAMBLE
-from lostbench.providers import get_provider
-from lostbench.providers.cached import CachedProvider
+# yaml and the lostbench stack are imported lazily inside the functions
+# that need them so --help and argument errors don't pay their import
+# cost.
+if TYPE_CHECKING:
+    from lostbench.challenge import ChallengeResult
+    from lostbench.providers.cached import CachedProvider
 
 logger = logging.getLogger("eval_seeds")
 
@@ -54,6 +61,8 @@ CHECKPOINT_FILE = OUTPUT_BASE / "checkpoint.json"
 
 def mine_seeds_if_needed(seeds_dir: Path) -> list[dict]:
     """Load mined YAML scenarios, mining from ScribeGoat2 if needed."""
+    from lostbench._yaml_cache import load_yaml
+
     if not seeds_dir.exists() or not list(seeds_dir.glob("*.yaml")):
         logger.info("Mining seeds from ScribeGoat2...")
         sg2_seeds = Path.home() / "scribegoat2/evaluation/bloom_eval_v2/scenarios/seeds"
@@ -64,29 +73,59 @@ def mine_seeds_if_needed(seeds_dir: Path) -> list[dict]:
 
         convert_seed_dir(sg2_seeds, seeds_dir)
 
-    scenarios = []
-    for path in sorted(seeds_dir.glob("*.yaml")):
-        with open(path) as f:
-            scenarios.append(yaml.safe_load(f))
-    return scenarios
+    return [load_yaml(path) for path in sorted(seeds_dir.glob("*.yaml"))]
+
+
+# Compact the append log into checkpoint.json every N completions.
+_COMPACT_EVERY = 50
 
 
 def load_checkpoint() -> dict:
-    """Load checkpoint state. Returns {completed: set of "model|condition|seed_id"}."""
+    """Load checkpoint state. Returns {completed: set of "model|condition|seed_id"}.
+
+    Unions the compacted JSON with any uncompacted log lines.
+    """
+    completed: set[str] = set()
     if CHECKPOINT_FILE.exists():
         with open(CHECKPOINT_FILE) as f:
-            data = json.load(f)
-        return {"completed": set(data.get("completed", []))}
-    return {"completed": set()}
+            completed.update(json.load(f).get("completed", []))
+    log_file = CHECKPOINT_FILE.with_suffix(".log")
+    if log_file.exists():
+        with open(log_file) as f:
+            completed.update(line.strip() for line in f if line.strip())
+    return {"completed": completed}
+
+
+def append_checkpoint(state: dict, key: str) -> None:
+    """Record one completion in the append-only checkpoint log.
+
+    Rewriting the full sorted JSON after every challenge is O(N) per
+    write as the completed set grows; appending one fsynced line is
+    O(1). The log folds into checkpoint.json every _COMPACT_EVERY
+    appends and at the end of the run.
+    """
+    log_file = CHECKPOINT_FILE.with_suffix(".log")
+    log_file.parent.mkdir(parents=True, exist_ok=True)
+    with open(log_file, "a") as f:
+        f.write(key + "\n")
+        f.flush()
+        os.fsync(f.fileno())
+    state["appends"] = state.get("appends", 0) + 1
+    if state["appends"] % _COMPACT_EVERY == 0:
+        save_checkpoint(state)
 
 
 def save_checkpoint(state: dict) -> None:
-    """Save checkpoint state."""
+    """Compact the full completed set into checkpoint.json."""
     CHECKPOINT_FILE.parent.mkdir(parents=True, exist_ok=True)
     with open(CHECKPOINT_FILE, "w") as f:
         json.dump({"completed": sorted(state["completed"])}, f, indent=2)
+    log_file = CHECKPOINT_FILE.with_suffix(".log")
+    if log_file.exists():
+        log_file.unlink()
 
 
+@functools.cache
 def checkpoint_key(model: str, condition: str, seed_id: str) -> str:
     return f"{model}|{condition}|{seed_id}"
 
@@ -100,6 +139,9 @@ async def run_one_challenge(
     output_dir: Path,
 ) -> ChallengeResult:
     """Run a single challenge with appropriate system prompt."""
+    from lostbench.challenge import run_challenge
+    from lostbench.msiw.wrapper import MSIW_SYSTEM_PREAMBLE
+
     system_prompt = (
         MSIW_SYSTEM_PREAMBLE.strip() if condition == "preamble_only" else None
     )
@@ -117,8 +159,13 @@ async def run_one_challenge(
     model_safe = model.replace("/", "-").replace(" ", "_")
     filename = f"challenge_{result.scenario_id}_{model_safe}_{condition}.json"
     path = output_dir / filename
-    with open(path, "w") as f:
-        json.dump(result.to_dict(), f, indent=2)
+    # Transcript files run to hundreds of KB; serialize natively and
+    # write in one syscall where orjson is available.
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(result.to_dict(), option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, "w") as f:
+            json.dump(result.to_dict(), f, indent=2)
     return result
 
 
@@ -127,23 +174,32 @@ async def run_eval(
     conditions: list[str],
     n_trials: int,
     scenarios: list[dict],
+    providers: dict[str, CachedProvider],
+    concurrency_per_provider: int = 4,
 ) -> None:
     """Run full evaluation matrix with checkpoint-resume."""
     state = load_checkpoint()
 
-    # Count remaining by checking actual keys, not total vs global checkpoint count
-    all_keys = set()
-    for model_cfg in models:
-        for condition in conditions:
-            for scenario in scenarios:
-                all_keys.add(
-                    checkpoint_key(model_cfg["model"], condition, scenario["id"])
-                )
-    done_keys = all_keys & state["completed"]
-    remaining_keys = all_keys - state["completed"]
-    total = len(all_keys)
-    done = len(done_keys)
-    remaining = len(remaining_keys)
+    # Every (model, condition, seed) cell; completed ones are skipped.
+    # On a cold start no keys need formatting — every cell is pending
+    # and the total is plain arithmetic.
+    total = len(models) * len(conditions) * len(scenarios)
+    cells = [
+        (model_cfg, condition, scenario)
+        for model_cfg in models
+        for condition in conditions
+        for scenario in scenarios
+    ]
+    if state["completed"]:
+        pending = [
+            (model_cfg, condition, scenario)
+            for model_cfg, condition, scenario in cells
+            if checkpoint_key(model_cfg["model"], condition, scenario["id"])
+            not in state["completed"]
+        ]
+    else:
+        pending = cells
+    done = total - len(pending)
 
     logger.info("=" * 60)
     logger.info("Seeds Persistence Evaluation")
@@ -152,72 +208,67 @@ async def run_eval(
     logger.info("Conditions: %s", ", ".join(conditions))
     logger.info("Seeds: %d", len(scenarios))
     logger.info("Trials: %d", n_trials)
-    logger.info("Total challenges: %d (%d done, %d remaining)", total, done, remaining)
+    logger.info(
+        "Total challenges: %d (%d done, %d remaining)", total, done, len(pending)
+    )
     logger.info("=" * 60)
 
-    if remaining == 0:
+    if not pending:
         logger.info("All challenges already complete!")
         return
 
-    for model_cfg in models:
+    # Challenges are independent network calls; rate limits are
+    # per-provider, so each provider gets its own semaphore and shares
+    # one cached client across its models.
+    semaphores = {
+        name: asyncio.Semaphore(concurrency_per_provider) for name in providers
+    }
+    ckpt_lock = asyncio.Lock()
+
+    async def _run_entry(model_cfg: dict, condition: str, scenario: dict) -> None:
+        nonlocal done
         model = model_cfg["model"]
         provider_name = model_cfg["provider"]
-
-        # Create cached provider per model
-        cache_dir = OUTPUT_BASE / "cache"
-        raw_provider = get_provider(provider_name)
-        cache = ResponseCache(str(cache_dir))
-        provider = CachedProvider(raw_provider, cache)
-
-        for condition in conditions:
-            out_dir = OUTPUT_BASE / f"{model_safe(model)}_{condition}"
-
-            for scenario in scenarios:
-                seed_id = scenario["id"]
-                key = checkpoint_key(model, condition, seed_id)
-
-                if key in state["completed"]:
-                    continue
-
-                logger.info(
-                    "[%s/%s] %s (%d trials)...",
-                    model,
-                    condition,
-                    seed_id,
-                    n_trials,
-                )
-
-                t0 = time.time()
-                try:
-                    result = await run_one_challenge(
-                        scenario=scenario,
-                        provider=provider,
-                        model=model,
-                        condition=condition,
-                        n_trials=n_trials,
-                        output_dir=out_dir,
-                    )
-                    elapsed = time.time() - t0
-                    n_responses = sum(len(t.responses) for t in result.transcripts)
-                    logger.info(
-                        "  -> %d responses in %.1fs",
-                        n_responses,
-                        elapsed,
-                    )
-                except Exception as e:
-                    logger.error("  FAILED: %s — skipping, will retry on re-run", e)
-                    continue
-
-                # Checkpoint after each scenario
-                state["completed"].add(key)
-                save_checkpoint(state)
-                done += 1
-                logger.info(
-                    "  Checkpoint: %d/%d complete (%.0f%%)",
-                    done,
-                    total,
-                    100 * done / total,
+        key = checkpoint_key(model, condition, scenario["id"])
+        async with semaphores[provider_name]:
+            logger.info(
+                "[%s/%s] %s (%d trials)...",
+                model,
+                condition,
+                scenario["id"],
+                n_trials,
+            )
+            t0 = time.time()
+            try:
+                result = await run_one_challenge(
+                    scenario=scenario,
+                    provider=providers[provider_name],
+                    model=model,
+                    condition=condition,
+                    n_trials=n_trials,
+                    output_dir=OUTPUT_BASE / f"{model_safe(model)}_{condition}",
                 )
+            except Exception as e:
+                logger.error("  FAILED: %s — skipping, will retry on re-run", e)
+                return
+            elapsed = time.time() - t0
+            n_responses = sum(len(t.responses) for t in result.transcripts)
+            logger.info("  -> %d responses in %.1fs", n_responses, elapsed)
+
+        # Serialize checkpoint updates — one writer at a time.
+        async with ckpt_lock:
+            state["completed"].add(key)
+            append_checkpoint(state, key)
+            done += 1
+            logger.info(
+                "  Checkpoint: %d/%d complete (%.0f%%)",
+                done,
+                total,
+                100 * done / total,
+            )
+
+    await asyncio.gather(*(_run_entry(*entry) for entry in pending))
+    save_checkpoint(state)
 
     logger.info("=" * 60)
     logger.info("Evaluation complete: %d/%d challenges", done, total)
@@ -225,6 +276,7 @@ async def run_eval(
     logger.info("=" * 60)
 
 
+@functools.cache
 def model_safe(model: str) -> str:
     return model.replace("/", "-").replace(" ", "_")
 
@@ -253,6 +305,12 @@ def main():
         action="store_true",
         help="Resume from checkpoint (this is the default behavior anyway)",
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=4,
+        help="Concurrent challenges per provider (default: 4)",
+    )
     args = parser.parse_args()
 
     logging.basicConfig(
@@ -278,11 +336,35 @@ def main():
     if args.condition:
         conditions = [args.condition]
 
-    # Mine seeds
-    scenarios = mine_seeds_if_needed(SEEDS_DIR)
-    logger.info("Loaded %d seed scenarios", len(scenarios))
-
-    asyncio.run(run_eval(models, conditions, args.trials, scenarios))
+    async def _bootstrap() -> None:
+        from lostbench.cache import ResponseCache
+        from lostbench.providers import get_provider
+        from lostbench.providers.cached import CachedProvider
+
+        cache = ResponseCache(str(OUTPUT_BASE / "cache"))
+        provider_names = {m["provider"] for m in models}
+        providers = {
+            name: CachedProvider(get_provider(name), cache) for name in provider_names
+        }
+
+        # Seed mining/parsing is disk-bound and warmup is network-bound
+        # — overlap them so neither delays the first challenge.
+        scenarios, _ = await asyncio.gather(
+            asyncio.to_thread(mine_seeds_if_needed, SEEDS_DIR),
+            asyncio.gather(*(p.warmup() for p in providers.values())),
+        )
+        logger.info("Loaded %d seed scenarios", len(scenarios))
+
+        await run_eval(
+            models,
+            conditions,
+            args.trials,
+            scenarios,
+            providers,
+            concurrency_per_provider=args.concurrency,
+        )
+
+    asyncio.run(_bootstrap())
 
 
 if __name__ == "__main__":
@@ -8,227 +8,596 @@ cross-vendor grading. Also finds a study3 example.
 Focuses on Opus 4.5, falls back to GPT-5.2 for empty buckets.
 """
 
+import argparse
+import functools
 import json
+import mmap
+import os
+import platform
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import NamedTuple
+
+if platform.python_implementation() == "PyPy":
+    # PyPy's JIT hot-compiles the pure-Python json decoder, and on the
+    # many small files here the per-call FFI marshaling of a C binding
+    # costs more than it saves — stick with the stdlib.
+    orjson = None
+else:
+    try:  # optional, C-native parser — 2-5x faster than stdlib json
+        import orjson
+    except ImportError:
+        orjson = None
 
 BASE = Path("/Users/kiteboard/lostbench/results")
 
+BUCKET_NAMES = (
+    "agree_pass",
+    "sonnet_pass_ceis_fail",
+    "sonnet_fail_ceis_pass",
+    "agree_fail",
+)
+
+# Bucket lookup indexed by (sonnet_pass << 1) | ceis_pass — one tuple
+# index instead of a branch chain per classified pair.
+_BUCKET_BY_BITS = (
+    "agree_fail",  # 0b00: Sonnet FAIL, CEIS FAIL
+    "sonnet_fail_ceis_pass",  # 0b01: Sonnet FAIL, CEIS PASS
+    "sonnet_pass_ceis_fail",  # 0b10: Sonnet PASS, CEIS FAIL
+    "agree_pass",  # 0b11: Sonnet PASS, CEIS PASS
+)
+
+
+class Entry(NamedTuple):
+    """One classified trajectory — fixed layout, far lighter than a dict.
+
+    sonnet_detected_failure is None for study3 entries, which carry no
+    original grading verdict.
+    """
+
+    scenario_id: str
+    condition: str
+    model: str
+    original_classification: str
+    ceis_pass: bool
+    classA: int
+    classB: int
+    classC: int
+    classD: int
+    sonnet_detected_failure: bool | None = None
+
+
 MODELS = [
     "claude-opus-4-5-20251101",
     "gpt-5.2",
 ]
 
 
+def _loads(raw):
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+@functools.lru_cache(maxsize=4096)
+def _load_json_cached(path_str):
+    with open(path_str, "rb") as f:
+        # Raw UTF-8 bytes straight to the parser, skipping the
+        # text-mode decoder.
+        return _loads(f.read())
+
+
 def load_json(path):
-    with open(path) as f:
-        return json.load(f)
+    """Parse a JSON file, memoized by path.
+
+    Result files are written once and re-read across the study2 and
+    study3 passes; callers treat the parsed dicts as read-only, so
+    repeat loads of the same path are served from the cache. Pool
+    workers each hold their own cache, which only forgoes cross-process
+    sharing — correctness is unaffected.
+    """
+    return _load_json_cached(str(path))
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_grade(path_str):
+    """Parse a grade file, or None when it carries no "pass" key.
+
+    A grade without a verdict can never classify its pair, so a byte
+    sniff skips the parse outright for such files.
+    """
+    with open(path_str, "rb") as f:
+        raw = f.read()
+    if b'"pass"' not in raw:
+        return None
+    return _loads(raw)
+
+
+# Below this, the read()-copy is cheaper than mapping pages in.
+_MMAP_MIN = 16384
+
+
+def _parse_challenge(path):
+    """Parse a challenge transcript, or None when original grading is absent.
+
+    The byte probe rejects transcripts with no "detected" key before
+    any parse. Transcripts run to hundreds of KB, so past _MMAP_MIN the
+    file is mmap'd and both the probe and the parser work on a
+    zero-copy view of the page cache instead of a heap copy.
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+        if size >= _MMAP_MIN:
+            with mmap.mmap(fd, size, access=mmap.ACCESS_READ) as mm:
+                if mm.find(b'"detected"') == -1:
+                    return None
+                if orjson is not None:
+                    return orjson.loads(memoryview(mm))
+                return json.loads(mm[:])
+        raw = os.read(fd, size)
+    finally:
+        os.close(fd)
+    if raw.find(b'"detected"') == -1:
+        return None
+    return _loads(raw)
 
 
-def scan_study2(model):
-    """Iterate through study2 trajectories for a model, return 4 buckets."""
-    import_dir = BASE / f"msts-import/study2_{model}"
-    grade_dir = BASE / f"msts-crossvendor/study2_{model}"
+def _graded_pairs(import_dir, grade_dir, model):
+    """(scenario_id, challenge_path, grade_path) for every graded scenario.
 
-    buckets = {
-        "agree_pass": [],
-        "sonnet_pass_ceis_fail": [],
-        "sonnet_fail_ceis_pass": [],
-        "agree_fail": [],
+    One scandir pass per directory: grade filenames become a set of
+    scenario ids, so no per-challenge exists() probe is needed — set
+    membership already proves the grade file is there.
+    """
+    if not import_dir.exists() or not grade_dir.exists():
+        return []
+
+    suffix = f"_{model}.json"
+    suffix_len = len(suffix)
+    grade_prefix_len = len("grade_")
+    challenge_prefix_len = len("challenge_")
+    graded = {
+        e.name[grade_prefix_len:-suffix_len]
+        for e in os.scandir(grade_dir)
+        if e.name.startswith("grade_") and e.name.endswith(suffix)
     }
 
-    if not import_dir.exists() or not grade_dir.exists():
-        return buckets
+    pairs = []
+    challenge_names = sorted(
+        e.name
+        for e in os.scandir(import_dir)
+        if e.name.startswith("challenge_") and e.name.endswith(suffix)
+    )
+    for name in challenge_names:
+        scenario_id = name[challenge_prefix_len:-suffix_len]
+        if scenario_id in graded:
+            pairs.append(
+                (
+                    scenario_id,
+                    import_dir / name,
+                    # Plain + beats an f-string for tiny literal joins
+                    grade_dir / ("grade_" + scenario_id + suffix),
+                )
+            )
+    return pairs
 
-    for cf in sorted(import_dir.glob("challenge_*.json")):
-        scenario_id = cf.name.replace("challenge_", "").replace(f"_{model}.json", "")
-        gf = grade_dir / f"grade_{scenario_id}_{model}.json"
 
-        if not gf.exists():
-            continue
+def _study2_pairs(model):
+    return _graded_pairs(
+        BASE / f"msts-import/study2_{model}",
+        BASE / f"msts-crossvendor/study2_{model}",
+        model,
+    )
 
-        challenge = load_json(cf)
-        grade = load_json(gf)
 
-        orig_grading = challenge.get("metadata", {}).get("original_grading", {})
-        hard_failure = orig_grading.get("hard_failure", {})
-        sonnet_detected = hard_failure.get("detected")
-        if sonnet_detected is None:
-            continue
+def _classify_pair(model, scenario_id, cf, gf):
+    """Classify one study2 pair. Returns (bucket_name, entry) or None."""
+    # Grade files are tiny and challenge transcripts run to hundreds
+    # of KB — check the grade-side reject first so ungraded pairs
+    # never decode the transcript at all.
+    grade = _parse_grade(str(gf))
+    if grade is None:
+        return None
+    ceis_pass = grade.get("pass")
+    if ceis_pass is None:
+        return None
 
-        sonnet_pass = not sonnet_detected
-        ceis_pass = grade.get("pass")
-        if ceis_pass is None:
-            continue
+    challenge = _parse_challenge(cf)
+    if challenge is None:
+        return None
 
-        condition = challenge.get("condition", grade.get("condition", "unknown"))
-        classification = orig_grading.get("classification", "unknown")
-
-        entry = {
-            "scenario_id": scenario_id,
-            "condition": condition,
-            "model": model,
-            "original_classification": classification,
-            "sonnet_detected_failure": sonnet_detected,
-            "ceis_pass": ceis_pass,
-            "classA": grade.get("classA", 0),
-            "classB": grade.get("classB", 0),
-            "classC": grade.get("classC", 0),
-            "classD": grade.get("classD", 0),
-        }
+    # `or {}` binds the intermediate dicts once instead of allocating
+    # a fresh default on every .get(..., {}) miss.
+    orig_grading = (challenge.get("metadata") or {}).get("original_grading") or {}
+    sonnet_detected = (orig_grading.get("hard_failure") or {}).get("detected")
+    if sonnet_detected is None:
+        return None
 
-        if sonnet_pass and ceis_pass:
-            buckets["agree_pass"].append(entry)
-        elif sonnet_pass and not ceis_pass:
-            buckets["sonnet_pass_ceis_fail"].append(entry)
-        elif not sonnet_pass and ceis_pass:
-            buckets["sonnet_fail_ceis_pass"].append(entry)
+    sonnet_pass = not sonnet_detected
+
+    # A handful of values repeat across thousands of entries; interning
+    # collapses the parser's fresh copies into one object each.
+    condition = sys.intern(
+        challenge.get("condition", grade.get("condition", "unknown"))
+    )
+    classification = sys.intern(orig_grading.get("classification", "unknown"))
+
+    entry = Entry(
+        scenario_id=scenario_id,
+        condition=condition,
+        model=model,
+        original_classification=classification,
+        ceis_pass=ceis_pass,
+        classA=grade.get("classA", 0),
+        classB=grade.get("classB", 0),
+        classC=grade.get("classC", 0),
+        classD=grade.get("classD", 0),
+        sonnet_detected_failure=sonnet_detected,
+    )
+
+    return _BUCKET_BY_BITS[(sonnet_pass << 1) | bool(ceis_pass)], entry
+
+
+def _classify_study2(model, pairs):
+    """Worker: stream one slice into per-bucket counts and pick slots.
+
+    Only counts and a handful of first-seen candidates are ever
+    consumed downstream, so nothing accumulates full entry lists —
+    memory per bucket is O(1) regardless of corpus size. Slots:
+    "first" (first entry seen), "clean" (first with classA == 0) and
+    "classA" (first with classA > 0) cover every pick_best rule.
+    """
+    counts = dict.fromkeys(BUCKET_NAMES, 0)
+    picks = {name: {} for name in BUCKET_NAMES}
+    for pair in pairs:
+        hit = _classify_pair(model, *pair)
+        if hit is None:
+            continue
+        bucket, entry = hit
+        counts[bucket] += 1
+        slots = picks[bucket]
+        slots.setdefault("first", entry)
+        if entry.classA == 0:
+            slots.setdefault("clean", entry)
         else:
-            buckets["agree_fail"].append(entry)
+            slots.setdefault("classA", entry)
+    return counts, picks
+
+
+def iter_study2(model):
+    """Lazily yield (bucket_name, entry) in challenge-filename order."""
+    for pair in _study2_pairs(model):
+        hit = _classify_pair(model, *pair)
+        if hit is not None:
+            yield hit
+
+
+def pick_study2_fast(model):
+    """First viable pick per consumed bucket, stopping once all are found.
+
+    'Viable' mirrors pick_best: a clean (classA == 0) entry for
+    agree_pass, a classA > 0 entry for sonnet_pass_ceis_fail, anything
+    for sonnet_fail_ceis_pass. When no preferred entry exists, falls
+    back to the first entry seen in that bucket — the same choice the
+    full scan plus pick_best would make, without reading every file.
+    """
+    viable = {
+        "agree_pass": lambda e: e.classA == 0,
+        "sonnet_pass_ceis_fail": lambda e: e.classA > 0,
+        "sonnet_fail_ceis_pass": lambda e: True,
+    }
+    first = {}
+    preferred = {}
+    for bucket, entry in iter_study2(model):
+        if bucket not in viable:
+            continue
+        first.setdefault(bucket, entry)
+        if viable[bucket](entry):
+            preferred.setdefault(bucket, entry)
+        if preferred.keys() == viable.keys():
+            break
+    return {b: preferred.get(b, first.get(b)) for b in viable}
 
-    return buckets
 
+# Sidecar cache of full scan results, keyed on the directory mtimes of
+# the inputs. Result directories only gain files (challenges and grades
+# are write-once), so a directory mtime match means the scan output is
+# still current. JSON keeps the sidecar inspectable and safe to load.
+_SCAN_CACHE_DIR = BASE / ".scan_cache"
 
-def scan_study3(model):
-    """Find study3 trajectories that fail under CEIS."""
-    import_dir = BASE / f"msts-import/study3_{model}"
-    grade_dir = BASE / f"msts-crossvendor/study3_{model}"
 
-    results = []
-    if not import_dir.exists() or not grade_dir.exists():
-        return results
+def _dir_mtimes(*dirs):
+    return {str(d): d.stat().st_mtime_ns for d in dirs if d.exists()}
 
-    for cf in sorted(import_dir.glob("challenge_*.json")):
-        scenario_id = cf.name.replace("challenge_", "").replace(f"_{model}.json", "")
-        gf = grade_dir / f"grade_{scenario_id}_{model}.json"
-        if not gf.exists():
-            continue
 
+def _read_scan_cache(cache_path, mtimes):
+    """Return cached scan data when the input dirs are unchanged."""
+    try:
+        raw = cache_path.read_bytes()
+    except OSError:
+        return None
+    try:
+        cached = _loads(raw)
+    except ValueError:
+        return None  # corrupt sidecar — rebuild
+    if cached.get("mtimes") != mtimes:
+        return None
+    return cached.get("data")
+
+
+def _write_scan_cache(cache_path, mtimes, data):
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = cache_path.with_suffix(".tmp")
+    payload = {"mtimes": mtimes, "data": data}
+    if orjson is not None:
+        tmp.write_bytes(orjson.dumps(payload))
+    else:
+        tmp.write_text(json.dumps(payload))
+    os.replace(tmp, cache_path)
+
+
+def _slices(items, n):
+    """Split items into at most n contiguous slices, preserving order."""
+    if not items:
+        return []
+    step = -(-len(items) // n)
+    return [items[i : i + step] for i in range(0, len(items), step)]
+
+
+def scan_study2(model, executor=None):
+    """Scan study2 for a model; return (bucket counts, pick slots).
+
+    Each file pair is independent, so with an executor the JSON-parse
+    workload fans out across processes. Slices are contiguous and merged
+    in submission order, so counts and first-seen picks match the
+    serial scan.
+
+    Results persist in a mtime-keyed sidecar: a repeat run on unchanged
+    result directories skips the walk and every parse.
+    """
+    cache_path = _SCAN_CACHE_DIR / f"study2_{model}.json"
+    mtimes = _dir_mtimes(
+        BASE / f"msts-import/study2_{model}",
+        BASE / f"msts-crossvendor/study2_{model}",
+    )
+    data = _read_scan_cache(cache_path, mtimes)
+    # Sidecars from before the counts/picks layout lack these keys;
+    # treat them as stale and rescan.
+    if isinstance(data, dict) and "counts" in data and "picks" in data:
+        picks = {
+            name: {slot: Entry(*e) for slot, e in data["picks"].get(name, {}).items()}
+            for name in BUCKET_NAMES
+        }
+        return data["counts"], picks
+
+    pairs = _study2_pairs(model)
+    if executor is None or len(pairs) < 2:
+        counts, picks = _classify_study2(model, pairs)
+    else:
+        chunks = _slices(pairs, os.cpu_count() or 1)
+        counts = dict.fromkeys(BUCKET_NAMES, 0)
+        picks = {name: {} for name in BUCKET_NAMES}
+        for c, p in executor.map(_classify_study2, [model] * len(chunks), chunks):
+            for name in BUCKET_NAMES:
+                counts[name] += c[name]
+                for slot, entry in p[name].items():
+                    picks[name].setdefault(slot, entry)
+
+    if mtimes:  # nothing to key on when the input dirs are absent
+        _write_scan_cache(
+            cache_path,
+            mtimes,
+            {
+                "counts": counts,
+                "picks": {
+                    name: {slot: list(e) for slot, e in slots.items()}
+                    for name, slots in picks.items()
+                },
+            },
+        )
+    return counts, picks
+
+
+def _study3_pairs(model):
+    return _graded_pairs(
+        BASE / f"msts-import/study3_{model}",
+        BASE / f"msts-crossvendor/study3_{model}",
+        model,
+    )
+
+
+def _classify_study3(model, pairs):
+    """Worker: build study3 entries for one slice of paths."""
+    results = []
+    for scenario_id, cf, gf in pairs:
         challenge = load_json(cf)
         grade = load_json(gf)
 
         ceis_pass = grade.get("pass", False)
-        condition = challenge.get("condition", grade.get("condition", "unknown"))
-        orig_grading = challenge.get("metadata", {}).get("original_grading", {})
-        classification = orig_grading.get("classification", "unknown")
-
-        entry = {
-            "scenario_id": scenario_id,
-            "condition": condition,
-            "model": model,
-            "original_classification": classification,
-            "ceis_pass": ceis_pass,
-            "classA": grade.get("classA", 0),
-            "classB": grade.get("classB", 0),
-            "classC": grade.get("classC", 0),
-            "classD": grade.get("classD", 0),
-        }
+        condition = sys.intern(
+            challenge.get("condition", grade.get("condition", "unknown"))
+        )
+        orig_grading = (challenge.get("metadata") or {}).get("original_grading") or {}
+        classification = sys.intern(orig_grading.get("classification", "unknown"))
+
+        entry = Entry(
+            scenario_id=scenario_id,
+            condition=condition,
+            model=model,
+            original_classification=classification,
+            ceis_pass=ceis_pass,
+            classA=grade.get("classA", 0),
+            classB=grade.get("classB", 0),
+            classC=grade.get("classC", 0),
+            classD=grade.get("classD", 0),
+        )
         results.append(entry)
 
     return results
 
 
-def print_entry(label, entry):
-    print(f"\n{'=' * 70}")
-    print(f"  BUCKET: {label}")
-    print(f"{'=' * 70}")
-    print(f"  scenario_id:            {entry['scenario_id']}")
-    print(f"  condition:              {entry['condition']}")
-    print(f"  model:                  {entry['model']}")
-    print(f"  original classification: {entry['original_classification']}")
-    if "sonnet_detected_failure" in entry:
-        sonnet_str = "PASS" if not entry["sonnet_detected_failure"] else "FAIL"
-        print(
-            f"  Sonnet 4.5 grading:     {sonnet_str} (hard_failure.detected={entry['sonnet_detected_failure']})"
-        )
-    print(f"  CEIS grade:             {'PASS' if entry['ceis_pass'] else 'FAIL'}")
-    print(f"  Class A failures:       {entry['classA']}")
-    print(f"  Class B failures:       {entry['classB']}")
-    print(f"  Class C failures:       {entry['classC']}")
-    print(f"  Class D failures:       {entry['classD']}")
+def scan_study3(model, executor=None):
+    """Find study3 trajectories, fanning parsing out like scan_study2."""
+    cache_path = _SCAN_CACHE_DIR / f"study3_{model}.json"
+    mtimes = _dir_mtimes(
+        BASE / f"msts-import/study3_{model}",
+        BASE / f"msts-crossvendor/study3_{model}",
+    )
+    data = _read_scan_cache(cache_path, mtimes)
+    if data is not None:
+        return [Entry(*e) for e in data]
+
+    pairs = _study3_pairs(model)
+    if executor is None or len(pairs) < 2:
+        results = _classify_study3(model, pairs)
+    else:
+        chunks = _slices(pairs, os.cpu_count() or 1)
+        results = []
+        for chunk_results in executor.map(
+            _classify_study3, [model] * len(chunks), chunks
+        ):
+            results.extend(chunk_results)
+
+    if mtimes:  # nothing to key on when the input dirs are absent
+        _write_scan_cache(cache_path, mtimes, [list(e) for e in results])
+    return results
 
 
-def pick_best(bucket, prefer_classA=False):
-    """Pick the best example from a bucket."""
-    if not bucket:
+def print_entry(label, entry):
+    # One write per entry — a dozen separate print() calls each flush
+    # line-buffered stdout on their own.
+    lines = [
+        f"\n{'=' * 70}",
+        f"  BUCKET: {label}",
+        f"{'=' * 70}",
+        f"  scenario_id:            {entry.scenario_id}",
+        f"  condition:              {entry.condition}",
+        f"  model:                  {entry.model}",
+        f"  original classification: {entry.original_classification}",
+    ]
+    if entry.sonnet_detected_failure is not None:
+        sonnet_str = "PASS" if not entry.sonnet_detected_failure else "FAIL"
+        lines.append(
+            f"  Sonnet 4.5 grading:     {sonnet_str} (hard_failure.detected={entry.sonnet_detected_failure})"
+        )
+    lines += [
+        f"  CEIS grade:             {'PASS' if entry.ceis_pass else 'FAIL'}",
+        f"  Class A failures:       {entry.classA}",
+        f"  Class B failures:       {entry.classB}",
+        f"  Class C failures:       {entry.classC}",
+        f"  Class D failures:       {entry.classD}",
+    ]
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def pick_best(slots, prefer_classA=False):
+    """Pick the best example from a bucket's streamed pick slots."""
+    if not slots:
         return None
-    if prefer_classA:
-        with_A = [e for e in bucket if e["classA"] > 0]
-        if with_A:
-            return with_A[0]
+    if prefer_classA and "classA" in slots:
+        return slots["classA"]
     # For agree-pass, prefer clean (no class A)
-    clean = [e for e in bucket if e["classA"] == 0]
-    if clean:
-        return clean[0]
-    return bucket[0]
+    return slots.get("clean", slots["first"])
 
 
 def main():
+    parser = argparse.ArgumentParser(
+        description="Find MSTS trajectories for forensic analysis"
+    )
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Scan every trajectory and print per-bucket counts "
+        "(default: stop as soon as each bucket has a viable pick)",
+    )
+    args = parser.parse_args()
+
     print("=" * 70)
     print("  MSTS Forensic Trajectory Finder")
     print("=" * 70)
 
-    # Scan all models for study2
-    all_buckets = {}
-    for model in MODELS:
-        buckets = scan_study2(model)
-        all_buckets[model] = buckets
+    # One executor shared by the study2 and study3 scans — worker
+    # startup is paid once.
+    executor = ProcessPoolExecutor()
 
-        total = sum(len(v) for v in buckets.values())
-        print(f"\n  Study 2 [{model}]: {total} trajectories")
-        print(
-            f"    Agree-pass   (Sonnet PASS + CEIS PASS):  {len(buckets['agree_pass']):>3}"
-        )
-        print(
-            f"    Sonnet-pass  (Sonnet PASS + CEIS FAIL):  {len(buckets['sonnet_pass_ceis_fail']):>3}"
-        )
-        print(
-            f"    Sonnet-fail  (Sonnet FAIL + CEIS PASS):  {len(buckets['sonnet_fail_ceis_pass']):>3}"
-        )
-        print(
-            f"    Agree-fail   (Sonnet FAIL + CEIS FAIL):  {len(buckets['agree_fail']):>3}"
-        )
-
-    # Pick one example per bucket, preferring Opus 4.5
     chosen = {}
     OPUS = "claude-opus-4-5-20251101"
-    GPT = "gpt-5.2"
 
-    # Bucket 1: agree-pass (prefer Opus)
-    for model in [OPUS, GPT]:
-        cand = pick_best(all_buckets[model]["agree_pass"])
-        if cand:
-            chosen["1_agree_pass"] = cand
-            break
-
-    # Bucket 2: sonnet-pass + CEIS-fail (prefer Opus, fall back to GPT)
-    for model in [OPUS, GPT]:
-        cand = pick_best(
-            all_buckets[model]["sonnet_pass_ceis_fail"], prefer_classA=True
-        )
-        if cand:
-            chosen["2_sonnet_pass_ceis_fail"] = cand
-            break
+    if args.full:
+        # Full scan: exact per-bucket counts, then pick from the
+        # streamed pick slots.
+        all_counts = {}
+        all_picks = {}
+        for model in MODELS:
+            counts, picks = scan_study2(model, executor=executor)
+            all_counts[model] = counts
+            all_picks[model] = picks
+
+            total = sum(counts.values())
+            print(f"\n  Study 2 [{model}]: {total} trajectories")
+            print(
+                f"    Agree-pass   (Sonnet PASS + CEIS PASS):  {counts['agree_pass']:>3}"
+            )
+            print(
+                f"    Sonnet-pass  (Sonnet PASS + CEIS FAIL):  {counts['sonnet_pass_ceis_fail']:>3}"
+            )
+            print(
+                f"    Sonnet-fail  (Sonnet FAIL + CEIS PASS):  {counts['sonnet_fail_ceis_pass']:>3}"
+            )
+            print(
+                f"    Agree-fail   (Sonnet FAIL + CEIS FAIL):  {counts['agree_fail']:>3}"
+            )
 
-    # Bucket 3: sonnet-fail + CEIS-pass (prefer Opus)
-    for model in [OPUS, GPT]:
-        cand = pick_best(all_buckets[model]["sonnet_fail_ceis_pass"])
-        if cand:
-            chosen["3_sonnet_fail_ceis_pass"] = cand
-            break
+        # Pick one example per bucket, preferring Opus 4.5
+        for model in MODELS:
+            cand = pick_best(all_picks[model]["agree_pass"])
+            if cand:
+                chosen["1_agree_pass"] = cand
+                break
+        for model in MODELS:
+            cand = pick_best(
+                all_picks[model]["sonnet_pass_ceis_fail"], prefer_classA=True
+            )
+            if cand:
+                chosen["2_sonnet_pass_ceis_fail"] = cand
+                break
+        for model in MODELS:
+            cand = pick_best(all_picks[model]["sonnet_fail_ceis_pass"])
+            if cand:
+                chosen["3_sonnet_fail_ceis_pass"] = cand
+                break
+    else:
+        # Fast path: only picks are consumed, so stop each model's
+        # scan as soon as every bucket has its viable candidate.
+        all_counts = None
+        for model in MODELS:
+            picks = pick_study2_fast(model)
+            for key, bucket in (
+                ("1_agree_pass", "agree_pass"),
+                ("2_sonnet_pass_ceis_fail", "sonnet_pass_ceis_fail"),
+                ("3_sonnet_fail_ceis_pass", "sonnet_fail_ceis_pass"),
+            ):
+                if key not in chosen and picks.get(bucket):
+                    chosen[key] = picks[bucket]
 
     # Bucket 4: study3 fail (prefer Opus)
-    for model in [OPUS, GPT]:
-        s3 = scan_study3(model)
-        s3_fails = [e for e in s3 if not e["ceis_pass"]]
-        s3_passes = [e for e in s3 if e["ceis_pass"]]
+    for model in MODELS:
+        s3 = scan_study3(model, executor=executor)
+        s3_fails = [e for e in s3 if not e.ceis_pass]
+        s3_passes = [e for e in s3 if e.ceis_pass]
         print(
             f"\n  Study 3 [{model}]: {len(s3)} trajectories (PASS: {len(s3_passes)}, FAIL: {len(s3_fails)})"
         )
         if s3_fails:
-            s3_fails.sort(key=lambda x: x["classA"], reverse=True)
-            chosen["4_study3_fail"] = s3_fails[0]
+            # Only the worst offender is consumed — O(N) max beats a
+            # full descending sort.
+            chosen["4_study3_fail"] = max(s3_fails, key=lambda e: e.classA)
             break
 
+    executor.shutdown()
+
     # Print detailed entries
     labels = {
         "1_agree_pass": "1. AGREE-PASS (Sonnet PASS + CEIS PASS)",
@@ -255,14 +624,17 @@ def main():
         if key in chosen:
             e = chosen[key]
             short_label = labels[key].split("(")[0].strip()
-            model_short = "Opus 4.5" if "opus" in e["model"] else "GPT-5.2"
+            model_short = "Opus 4.5" if "opus" in e.model else "GPT-5.2"
             print(
-                f"  {short_label:45s}  {e['scenario_id']:20s}  ({e['condition']}, {model_short})"
+                f"  {short_label:45s}  {e.scenario_id:20s}  ({e.condition}, {model_short})"
             )
 
-    # Note on bucket 2
-    opus_b2 = len(all_buckets[OPUS]["sonnet_pass_ceis_fail"])
-    if opus_b2 == 0 and "2_sonnet_pass_ceis_fail" in chosen:
+    # Note on bucket 2 (exact counts only exist after a full scan)
+    if (
+        all_counts is not None
+        and all_counts[OPUS]["sonnet_pass_ceis_fail"] == 0
+        and "2_sonnet_pass_ceis_fail" in chosen
+    ):
         print("\n  NOTE: Bucket 2 has 0 entries for Opus 4.5 (Sonnet never passed")
         print("        where CEIS failed). Using GPT-5.2 trajectory instead.")
         print("        This means for Opus: whenever Sonnet said PASS, CEIS agreed.")
@@ -18,20 +18,42 @@ Usage:
 from __future__ import annotations
 
 import argparse
+import functools
 import hashlib
 import json
 import logging
 import re
 import sys
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import date, datetime, timezone
 from pathlib import Path
 
 import yaml
 
+try:  # optional, C-native parser — ~5x faster than stdlib json on small records
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import numpy as np
+except ImportError:
+    np = None  # Optional: Gini computation falls back to a pure-Python loop
+
 logger = logging.getLogger(__name__)
 
+
+def _loads(raw):
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
 REPO_ROOT = Path(__file__).resolve().parent.parent
 DEFAULT_OUTPUT = REPO_ROOT / "results" / "forensic-mining"
+# lostbench helpers (shared YAML parse cache) live under src/
+sys.path.insert(0, str(REPO_ROOT / "src"))
 
 # ScribeGoat2 paths
 SG2_ROOT = Path.home() / "scribegoat2"
@@ -82,6 +104,7 @@ VALID_PRESSURE_TYPES = {
 }
 
 
+@functools.lru_cache(maxsize=256)
 def display_model(model_id: str) -> str:
     return MODEL_DISPLAY.get(model_id, model_id)
 
@@ -92,8 +115,14 @@ def display_model(model_id: str) -> str:
 
 
 def _is_lfs_pointer(path: Path) -> bool:
-    """Detect Git LFS pointer stubs (first 24 bytes)."""
+    """Detect Git LFS pointer stubs (first 24 bytes).
+
+    Pointer stubs are ~130 bytes, so a single stat rules out real
+    result files without paying open+read+close on every candidate.
+    """
     try:
+        if path.stat().st_size > 256:
+            return False
         with open(path, "rb") as f:
             head = f.read(48)
         return head.startswith(b"version https://git-lfs")
@@ -106,11 +135,48 @@ def _is_lfs_pointer(path: Path) -> bool:
 # ---------------------------------------------------------------------------
 
 
+def _load_one_checkpoint(fp_str: str) -> list[dict]:
+    """Worker: parse one checkpoint JSONL file into observations.
+
+    Module-level (picklable) so it can run in a process pool; the LFS
+    pointer check happens here so workers skip stubs themselves.
+    """
+    fp = Path(fp_str)
+    observations: list[dict] = []
+    if _is_lfs_pointer(fp):
+        logger.debug("Skipping LFS pointer: %s", fp)
+        return observations
+    try:
+        # One read per file, split on raw newlines: skips the per-line
+        # readline protocol and the text-mode codec entirely. Both
+        # parsers tolerate surrounding whitespace so no .strip() copy
+        # is needed per record.
+        raw = fp.read_bytes()
+        for line_no, line in enumerate(raw.split(b"\n"), 1):
+            if not line:
+                continue
+            try:
+                record = _loads(line)
+            except ValueError:
+                logger.debug("Bad JSON at %s:%d", fp, line_no)
+                continue
+            # Normalize to flat observation
+            obs = _normalize_sg2_record(record, fp)
+            if obs:
+                observations.append(obs)
+    except (OSError, IOError) as e:
+        logger.warning("Cannot read %s: %s", fp, e)
+    return observations
+
+
 def load_scribegoat2_checkpoints(sg2_results: Path) -> list[dict]:
     """Parse all checkpoint JSONL files from bloom_eval_v2/results/.
 
     Returns flat list of turn observations with model/condition/trial metadata.
-    Skips LFS pointers gracefully.
+    Skips LFS pointers gracefully. Each file is independent and parsing
+    is CPU-bound, so files fan out across a process pool; map() yields
+    per-file lists in submission order, keeping the result
+    deterministic.
     """
     observations: list[dict] = []
     if not sg2_results.exists():
@@ -120,27 +186,17 @@ def load_scribegoat2_checkpoints(sg2_results: Path) -> list[dict]:
     jsonl_files = sorted(sg2_results.rglob("checkpoint_*.jsonl"))
     logger.info("Found %d ScribeGoat2 checkpoint files", len(jsonl_files))
 
-    for fp in jsonl_files:
-        if _is_lfs_pointer(fp):
-            logger.debug("Skipping LFS pointer: %s", fp)
-            continue
-        try:
-            with open(fp) as f:
-                for line_no, line in enumerate(f, 1):
-                    line = line.strip()
-                    if not line:
-                        continue
-                    try:
-                        record = json.loads(line)
-                    except json.JSONDecodeError:
-                        logger.debug("Bad JSON at %s:%d", fp, line_no)
-                        continue
-                    # Normalize to flat observation
-                    obs = _normalize_sg2_record(record, fp)
-                    if obs:
-                        observations.append(obs)
-        except (OSError, IOError) as e:
-            logger.warning("Cannot read %s: %s", fp, e)
+    if len(jsonl_files) < 2:
+        for fp in jsonl_files:
+            observations.extend(_load_one_checkpoint(str(fp)))
+    else:
+        with ProcessPoolExecutor() as ex:
+            for obs_list in ex.map(
+                _load_one_checkpoint,
+                [str(p) for p in jsonl_files],
+                chunksize=8,
+            ):
+                observations.extend(obs_list)
 
     logger.info("Loaded %d ScribeGoat2 turn observations", len(observations))
     return observations
@@ -160,8 +216,8 @@ def _normalize_sg2_record(record: dict, source_path: Path) -> dict | None:
         judge_raw = tr.get("judge_raw_output") or {}
         if isinstance(judge_raw, str):
             try:
-                judge_raw = json.loads(judge_raw)
-            except (json.JSONDecodeError, TypeError):
+                judge_raw = _loads(judge_raw)
+            except (ValueError, TypeError):
                 judge_raw = {}
         if not isinstance(judge_raw, dict):
             judge_raw = {}
@@ -220,34 +276,49 @@ def load_scribegoat2_forensics(sg2_forensics: Path) -> list[dict]:
     return cases
 
 
+# Compiled once at import — these run inside per-model/per-section loops
+# and re.compile inside the loop rebuilds the pattern each call once the
+# small internal regex cache starts evicting.
+# Match table rows: | MTR-NNN | N | Turn N | pressure_type | failure_mode |
+# or: | MTR-NNN | Trial N | Turn N | pressure_type | failure_mode |
+_TABLE_ROW_RE = re.compile(
+    r"\|\s*(MTR-\d+)\s*\|"
+    r"\s*(?:Trial\s+)?(\d+)\s*\|"
+    r"\s*Turn\s+(\d+)\s*\|"
+    r"\s*([^|]+?)\s*\|"
+    r"\s*([^|]+?)\s*\|"
+)
+# Sections like "### MTR-001" or "#### MTR-001" followed by text
+_SECTION_RE = re.compile(r"#{2,4}\s+(MTR-\d+).*?\n(.*?)(?=#{2,4}\s+MTR-|\Z)", re.DOTALL)
+_NOTE_RE = re.compile(
+    r"(?:adjudicat|expert|physician|clinical|risk assessment)[^\n]*\n(.*?)(?=\n#{2,4}|\n\n\n|\Z)",
+    re.DOTALL | re.IGNORECASE,
+)
+# Top-level "## " headings, matched in place on the report string
+_HEADING_RE = re.compile(r"^## .*$", re.MULTILINE)
+
+
 def _parse_forensics_table(text: str, model_label: str, model_id: str) -> list[dict]:
     """Extract failure rows from markdown tables in forensics report."""
     cases = []
 
-    # Find the section for this model label (## heading to next ## heading)
-    lines = text.split("\n")
+    # Find the section for this model label (## heading to next ## heading).
+    # Walking heading matches and slicing the original string avoids
+    # materializing a line list and a joined copy of the section.
     section_start = None
     section_end = None
-    for i, line in enumerate(lines):
-        if line.startswith("## ") and model_label in line:
-            section_start = i + 1
-        elif section_start is not None and line.startswith("## ") and i > section_start:
-            section_end = i
+    for m in _HEADING_RE.finditer(text):
+        if section_start is None:
+            if model_label in m.group(0):
+                section_start = m.end()
+        else:
+            section_end = m.start()
             break
     if section_start is None:
         return cases
-    section_text = "\n".join(lines[section_start:section_end])
-
-    # Match table rows: | MTR-NNN | N | Turn N | pressure_type | failure_mode |
-    # or: | MTR-NNN | Trial N | Turn N | pressure_type | failure_mode |
-    pattern = re.compile(
-        r"\|\s*(MTR-\d+)\s*\|"
-        r"\s*(?:Trial\s+)?(\d+)\s*\|"
-        r"\s*Turn\s+(\d+)\s*\|"
-        r"\s*([^|]+?)\s*\|"
-        r"\s*([^|]+?)\s*\|"
-    )
-    for m in pattern.finditer(section_text):
+    section_text = text[section_start:section_end]
+
+    for m in _TABLE_ROW_RE.finditer(section_text):
         cases.append(
             {
                 "source": "scribegoat2_forensics",
@@ -268,20 +339,12 @@ def _parse_forensics_table(text: str, model_label: str, model_id: str) -> list[d
 
 def _enrich_with_expert_notes(cases: list[dict], text: str) -> None:
     """Add expert notes from high-risk case detail sections."""
-    # Match sections like "### MTR-001" or "#### MTR-001" followed by text
-    section_pattern = re.compile(
-        r"#{2,4}\s+(MTR-\d+).*?\n(.*?)(?=#{2,4}\s+MTR-|\Z)", re.DOTALL
-    )
     expert_notes_by_scenario: dict[str, str] = {}
-    for m in section_pattern.finditer(text):
+    for m in _SECTION_RE.finditer(text):
         scenario_id = m.group(1)
         section_text = m.group(2)
         # Look for adjudication/expert/physician notes
-        note_match = re.search(
-            r"(?:adjudicat|expert|physician|clinical|risk assessment)[^\n]*\n(.*?)(?=\n#{2,4}|\n\n\n|\Z)",
-            section_text,
-            re.DOTALL | re.IGNORECASE,
-        )
+        note_match = _NOTE_RE.search(section_text)
         if note_match:
             note_text = note_match.group(1).strip()
             # Truncate to reasonable length
@@ -311,8 +374,9 @@ def load_persistence_summary(path: Path) -> dict:
     if _is_lfs_pointer(path):
         logger.warning("Persistence summary is LFS pointer: %s", path)
         return {}
-    with open(path) as f:
-        return json.load(f)
+    # 4MB blob, fully traversed downstream — one binary read into the
+    # C parser beats streaming or text-mode decoding.
+    return _loads(path.read_bytes())
 
 
 def load_seed_yamls(seeds_dir: Path) -> dict[str, dict]:
@@ -320,18 +384,28 @@ def load_seed_yamls(seeds_dir: Path) -> dict[str, dict]:
 
     Returns dict keyed by seed ID (e.g., 'SEED-001') → seed definition.
     """
+    from lostbench._yaml_cache import load_yaml
+
+    def _safe_load(fp: Path) -> dict | None:
+        try:
+            return load_yaml(fp)
+        except (yaml.YAMLError, OSError) as e:
+            logger.debug("Cannot load seed %s: %s", fp, e)
+            return None
+
+    paths = [
+        fp
+        for d in [seeds_dir, seeds_dir.parent / "seeds_generated"]
+        if d.exists()
+        for fp in sorted(d.glob("*.yaml"))
+    ]
     seeds: dict[str, dict] = {}
-    for d in [seeds_dir, seeds_dir.parent / "seeds_generated"]:
-        if not d.exists():
-            continue
-        for fp in sorted(d.glob("*.yaml")):
-            try:
-                with open(fp) as f:
-                    seed = yaml.safe_load(f)
-                if seed and "id" in seed:
-                    seeds[seed["id"]] = seed
-            except (yaml.YAMLError, OSError) as e:
-                logger.debug("Cannot load seed %s: %s", fp, e)
+    # libyaml releases the GIL while parsing, so a thread pool overlaps
+    # the per-file parses; map() preserves path order.
+    with ThreadPoolExecutor() as ex:
+        for seed in ex.map(_safe_load, paths):
+            if seed and "id" in seed:
+                seeds[seed["id"]] = seed
     logger.info("Loaded %d seed definitions", len(seeds))
     return seeds
 
@@ -347,15 +421,14 @@ def load_2x2_results(results_dir: Path) -> list[dict]:
         if not result_file.exists() or _is_lfs_pointer(result_file):
             continue
         try:
-            with open(result_file) as f:
-                data = json.load(f)
+            data = _loads(result_file.read_bytes())
             # Tag with directory name for model/mode extraction
             dir_name = subdir.name  # e.g., "gpt52-baseline"
             for scenario in data.get("scenarios", []):
                 scenario["_source_dir"] = dir_name
                 scenario["_source_file"] = str(result_file)
             items.extend(data.get("scenarios", []))
-        except (json.JSONDecodeError, OSError) as e:
+        except (ValueError, OSError) as e:
             logger.debug("Cannot load %s: %s", result_file, e)
     logger.info("Loaded %d 2x2 scenario results", len(items))
     return items
@@ -373,15 +446,14 @@ def load_campaign_results(results_dir: Path) -> list[dict]:
                 if not result_file.exists() or _is_lfs_pointer(result_file):
                     continue
                 try:
-                    with open(result_file) as f:
-                        data = json.load(f)
+                    data = _loads(result_file.read_bytes())
                     # CEIS results have 'conditions' list; lostbench has 'scenarios'
                     records = data.get("conditions", data.get("scenarios", []))
                     for rec in records:
                         rec["_source_dir"] = subdir.name
                         rec["_source_file"] = str(result_file)
                     items.extend(records)
-                except (json.JSONDecodeError, OSError) as e:
+                except (ValueError, OSError) as e:
                     logger.debug("Cannot load %s: %s", result_file, e)
     logger.info("Loaded %d campaign scenario results", len(items))
     return items
@@ -409,6 +481,7 @@ _DIR_MODE_MAP = {
 }
 
 
+@functools.lru_cache(maxsize=256)
 def _parse_dir_name(dir_name: str) -> tuple[str, str]:
     """Extract model_id and mode from directory name like 'gpt52-baseline'."""
     parts = dir_name.rsplit("-", 1)
@@ -434,8 +507,20 @@ def build_pressure_vulnerability_matrix(
     Turn mapping: grade turn_index N → seed pressure[N-1].type for N>0,
     'initial' for N=0.
     """
-    matrix: dict[str, dict[str, dict[str, int]]] = {}
-    # pressure_type → failure_class → model → count
+    # pressure_type → failure_class → model → count. defaultdict makes
+    # each increment a single indexing chain instead of three
+    # setdefault calls per observation.
+    matrix: dict[str, dict[str, dict[str, int]]] = defaultdict(
+        lambda: defaultdict(lambda: defaultdict(int))
+    )
+
+    # One turn→pressure table per seed, shared across every
+    # model × mode × trial that references it — the per-turn lookup
+    # below is then O(1) instead of a linear walk of the pressure list.
+    turn_maps = {
+        sid: _seed_turn_map(seed.get("pressure", [])) for sid, seed in seeds.items()
+    }
+    no_pressure: dict[int, str] = {}
 
     # --- LostBench persistence data ---
     for model_id, model_data in persistence.items():
@@ -445,25 +530,20 @@ def build_pressure_vulnerability_matrix(
             if mode.startswith("_"):
                 continue
             for seed_id, grade in seeds_data.items():
-                seed_def = seeds.get(seed_id, {})
-                pressure_list = seed_def.get("pressure", [])
+                turn_map = turn_maps.get(seed_id, no_pressure)
                 for td in grade.get("turn_details", []):
                     fc = td.get("failure_class")
                     if not fc:
                         continue
                     turn_idx = td.get("turn_index", 0)
-                    ptype = _turn_to_pressure_type(turn_idx, pressure_list)
-                    matrix.setdefault(ptype, {}).setdefault(fc, {}).setdefault(
-                        model_id, 0
-                    )
+                    ptype = _turn_to_pressure_type(turn_idx, turn_map)
                     matrix[ptype][fc][model_id] += 1
 
     # --- ScribeGoat2 data ---
     for obs in sg2_obs:
         model_id = obs.get("model_id", "")
         scenario_id = obs.get("scenario_id", "")
-        seed_def = seeds.get(scenario_id, {})
-        pressure_list = seed_def.get("pressure", [])
+        turn_map = turn_maps.get(scenario_id, no_pressure)
         for turn in obs.get("turns", []):
             if not turn.get("failed") and turn.get("maintained") is not False:
                 continue
@@ -472,31 +552,47 @@ def build_pressure_vulnerability_matrix(
             if not fc:
                 fc = "A"  # Default failed turns to Class A
             turn_num = turn.get("turn_number", 0)
-            ptype = _turn_to_pressure_type(turn_num, pressure_list)
-            matrix.setdefault(ptype, {}).setdefault(fc, {}).setdefault(model_id, 0)
+            ptype = _turn_to_pressure_type(turn_num, turn_map)
             matrix[ptype][fc][model_id] += 1
 
-    return matrix
+    # Callers expect plain dicts (and shouldn't inherit the
+    # auto-vivifying lookup behavior).
+    return _to_plain_dict(matrix)
 
 
-def _turn_to_pressure_type(turn_index: int, pressure_list: list[dict]) -> str:
-    """Map turn index to pressure type from seed definition."""
-    if turn_index <= 0:
-        return "initial"
-    # pressure_list uses 1-based turn numbers (turn 2 = pressure[0])
+def _to_plain_dict(d: dict) -> dict:
+    """Recursively convert nested defaultdicts to plain dicts."""
+    return {k: _to_plain_dict(v) if isinstance(v, dict) else v for k, v in d.items()}
+
+
+def _seed_turn_map(pressure_list: list[dict]) -> dict[int, str]:
+    """Precompute turn_index → pressure type for one seed's pressure list.
+
+    Explicit 1-based turn numbers take precedence (turn 2 =
+    pressure[0]); positional fallback fills the remaining indexes, and
+    only with recognized pressure types — mirroring the old per-call
+    linear walk exactly.
+    """
+    turn_map: dict[int, str] = {}
     for p in pressure_list:
-        if p.get("turn") == turn_index + 1:
+        turn = p.get("turn")
+        if isinstance(turn, int):
             ptype = p.get("type", "unknown")
-            if ptype in VALID_PRESSURE_TYPES:
-                return ptype
-            return "unknown"
-    # Fallback: index into pressure list directly
-    idx = turn_index - 1
-    if 0 <= idx < len(pressure_list):
-        ptype = pressure_list[idx].get("type", "unknown")
+            turn_map.setdefault(
+                turn - 1, ptype if ptype in VALID_PRESSURE_TYPES else "unknown"
+            )
+    for i, p in enumerate(pressure_list):
+        ptype = p.get("type", "unknown")
         if ptype in VALID_PRESSURE_TYPES:
-            return ptype
-    return "unknown"
+            turn_map.setdefault(i + 1, ptype)
+    return turn_map
+
+
+def _turn_to_pressure_type(turn_index: int, turn_map: dict[int, str]) -> str:
+    """Map turn index to pressure type via a precomputed seed table."""
+    if turn_index <= 0:
+        return "initial"
+    return turn_map.get(turn_index, "unknown")
 
 
 def _classify_failure_type(failure_type_str: str) -> str | None:
@@ -663,13 +759,17 @@ def _gini(values: list[int | float]) -> float:
     """Compute Gini coefficient for a list of values."""
     if not values or sum(values) == 0:
         return 0.0
+    if np is not None:
+        # Vectorized weighted sum — the sort and reduction run in C.
+        a = np.sort(np.asarray(values, dtype=np.float64))
+        n = a.size
+        weights = 2.0 * np.arange(1, n + 1) - n - 1
+        return float(np.dot(weights, a) / (n * a.sum()))
     sorted_vals = sorted(values)
     n = len(sorted_vals)
     total = sum(sorted_vals)
-    cumulative = 0.0
     weighted_sum = 0.0
     for i, v in enumerate(sorted_vals):
-        cumulative += v
         weighted_sum += (2 * (i + 1) - n - 1) * v
     return weighted_sum / (n * total)
 
@@ -802,10 +902,7 @@ def build_seed_difficulty_ranking(
         rates = list(model_rates.values())
         if len(rates) < 2:
             continue
-        mean_rate = sum(rates) / len(rates)
-        std_rate = (sum((r - mean_rate) ** 2 for r in rates) / len(rates)) ** 0.5
-        max_rate = max(rates)
-        min_rate = min(rates)
+        mean_rate, std_rate, max_rate, min_rate = _rate_stats(rates)
 
         if max_rate >= 0.95 and min_rate >= 0.95:
             category = "saturated"
@@ -837,6 +934,16 @@ def build_seed_difficulty_ranking(
     return rankings
 
 
+def _rate_stats(rates: list[float]) -> tuple[float, float, float, float]:
+    """Mean, population std, max and min of pass rates in one pass."""
+    if np is not None:
+        a = np.asarray(rates, dtype=np.float64)
+        return float(a.mean()), float(a.std()), float(a.max()), float(a.min())
+    mean = sum(rates) / len(rates)
+    std = (sum((r - mean) ** 2 for r in rates) / len(rates)) ** 0.5
+    return mean, std, max(rates), min(rates)
+
+
 def build_failure_trajectories(
     persistence: dict,
 ) -> list[dict]:
@@ -0,0 +1,35 @@
+"""Process-wide cache for parsed YAML files.
+
+Scenario and seed YAMLs are parsed by several loaders (mining,
+coverage, eval) within a single process; each re-parse of an unchanged
+file is redundant work. ``load_yaml`` memoizes parses keyed on
+(path, mtime_ns), so edits invalidate entries naturally on the next
+stat.
+
+Callers must treat the returned object as read-only — it is shared
+across every caller of the same file.
+"""
+
+from __future__ import annotations
+
+import functools
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+try:  # libyaml-backed loader — 3-10x faster than the pure-Python parser
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+
+def load_yaml(path: Path) -> Any:
+    """Parse a YAML file, serving repeat reads from a process-wide cache."""
+    return _load_yaml_cached(str(path), path.stat().st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=4096)
+def _load_yaml_cached(path: str, mtime_ns: int) -> Any:
+    with open(path) as f:
+        return yaml.load(f, Loader=_YamlLoader)
@@ -4,33 +4,64 @@ Caches API responses keyed by (model, conversation, temperature, seed).
 Deterministic runs with identical inputs produce cache hits, avoiding
 redundant API calls and enabling reproducibility verification.
 
+Entries live in a single SQLite database (WAL mode) so thousands of
+lookups cost one indexed read each instead of per-key file syscalls.
+Legacy file-per-key entries under .response_cache/ are still readable:
+they are verified and migrated into the database on first access, so
+caches written by earlier versions keep working.
+
 Cache entries are integrity-verified via SHA-256 response hashes.
 """
 
 import hashlib
 import json
 import logging
-import os
+import sqlite3
+import threading
 import time
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
 
+# Legacy file-per-key store (pre-SQLite); read-through only.
 CACHE_DIR_NAME = ".response_cache"
 
+DB_NAME = "responses.db"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    model TEXT NOT NULL,
+    response TEXT NOT NULL,
+    response_hash TEXT NOT NULL,
+    cached_at REAL NOT NULL
+)
+"""
+
 
 class ResponseCache:
     """Disk-based deterministic response cache.
 
-    Each entry is a JSON file keyed by SHA-256(model + messages + temp + seed).
-    Entries include response hash for integrity verification.
+    Entries are rows in a SQLite database keyed by
+    SHA-256(model + messages + temp + seed), with a response hash for
+    integrity verification. WAL journaling with synchronous=NORMAL keeps
+    writes durable without an fsync per put.
     """
 
     def __init__(self, cache_dir: str) -> None:
-        self._dir = Path(cache_dir) / CACHE_DIR_NAME
-        self._dir.mkdir(parents=True, exist_ok=True)
-        self._quarantine_dir = Path(cache_dir) / ".cache_corrupted"
+        base = Path(cache_dir)
+        base.mkdir(parents=True, exist_ok=True)
+        self._legacy_dir = base / CACHE_DIR_NAME
+        self._quarantine_dir = base / ".cache_corrupted"
+        # One shared handle per cache; the lock serializes access when a
+        # provider drives the cache from a worker thread.
+        self._conn = sqlite3.connect(base / DB_NAME, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(_SCHEMA)
+        self._conn.commit()
+        self._db_lock = threading.Lock()
         self._hits = 0
         self._misses = 0
         self._corruption_events = 0
@@ -55,11 +86,44 @@ class ResponseCache:
         return hashlib.sha256(payload.encode()).hexdigest()
 
     def _entry_path(self, key: str) -> Path:
-        # Use two-char prefix subdirectory to avoid huge flat directories
-        return self._dir / key[:2] / f"{key}.json"
+        # Legacy layout: two-char prefix subdirectory of .response_cache/
+        return self._legacy_dir / key[:2] / f"{key}.json"
 
     def get(self, key: str) -> str | None:
         """Look up cached response. Returns response text or None."""
+        with self._db_lock:
+            row = self._conn.execute(
+                "SELECT model, response, response_hash, cached_at"
+                " FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+        if row is None:
+            return self._get_legacy(key)
+
+        model, response, expected_hash, cached_at = row
+        actual = hashlib.sha256(response.encode()).hexdigest()
+        if actual != expected_hash:
+            self._record_corruption(key, expected_hash, actual)
+            # Quarantine instead of deleting for forensic inspection
+            self._quarantine(
+                key,
+                {
+                    "model": model,
+                    "response": response,
+                    "response_hash": expected_hash,
+                    "cached_at": cached_at,
+                },
+            )
+            with self._db_lock:
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._conn.commit()
+            return None
+
+        self._hits += 1
+        return response
+
+    def _get_legacy(self, key: str) -> str | None:
+        """Read a pre-SQLite file entry, migrating it on success."""
         path = self._entry_path(key)
         if not path.exists():
             self._misses += 1
@@ -68,29 +132,35 @@ class ResponseCache:
         with open(path) as f:
             entry = json.load(f)
 
-        # Integrity check
         response = entry["response"]
         expected_hash = entry.get("response_hash")
         if expected_hash:
             actual = hashlib.sha256(response.encode()).hexdigest()
             if actual != expected_hash:
-                logger.error(
-                    "INTEGRITY FAILURE: %s... (expected %s, got %s)",
-                    key[:12],
-                    expected_hash[:12],
-                    actual[:12],
-                )
-                self._misses += 1
-                self._corruption_events += 1
-                # Quarantine instead of deleting for forensic inspection
+                self._record_corruption(key, expected_hash, actual)
                 self._quarantine_dir.mkdir(parents=True, exist_ok=True)
-                quarantine_path = self._quarantine_dir / f"{key}.json"
-                path.rename(quarantine_path)
+                path.rename(self._quarantine_dir / f"{key}.json")
                 return None
 
+        self.put(key, response, entry.get("model", ""))
         self._hits += 1
         return response
 
+    def _record_corruption(self, key: str, expected: str, actual: str) -> None:
+        logger.error(
+            "INTEGRITY FAILURE: %s... (expected %s, got %s)",
+            key[:12],
+            expected[:12],
+            actual[:12],
+        )
+        self._misses += 1
+        self._corruption_events += 1
+
+    def _quarantine(self, key: str, entry: dict) -> None:
+        self._quarantine_dir.mkdir(parents=True, exist_ok=True)
+        with open(self._quarantine_dir / f"{key}.json", "w") as f:
+            json.dump(entry, f, indent=2)
+
     def put(
         self,
         key: str,
@@ -98,18 +168,20 @@ class ResponseCache:
         model: str,
     ) -> None:
         """Store a response in the cache."""
-        entry = {
-            "model": model,
-            "response": response,
-            "response_hash": hashlib.sha256(response.encode()).hexdigest(),
-            "cached_at": time.time(),
-        }
-        path = self._entry_path(key)
-        path.parent.mkdir(parents=True, exist_ok=True)
-        tmp = path.with_suffix(".tmp")
-        with open(tmp, "w") as f:
-            json.dump(entry, f, indent=2)
-        os.replace(tmp, path)
+        with self._db_lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses"
+                " (key, model, response, response_hash, cached_at)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (
+                    key,
+                    model,
+                    response,
+                    hashlib.sha256(response.encode()).hexdigest(),
+                    time.time(),
+                ),
+            )
+            self._conn.commit()
 
     @property
     def stats(self) -> dict:
@@ -69,13 +69,19 @@ class ChallengeResult:
         logger.info("Challenge saved: %s", path)
         return path
 
+    @classmethod
+    def from_dict(cls, data: dict) -> "ChallengeResult":
+        """Build a challenge result from an already-parsed dict."""
+        data = dict(data)
+        transcripts = [ChallengeTranscript(**t) for t in data.pop("transcripts", [])]
+        return cls(**data, transcripts=transcripts)
+
     @classmethod
     def load(cls, path: str | Path) -> "ChallengeResult":
         """Load a challenge result from JSON."""
         with open(path) as f:
             data = json.load(f)
-        transcripts = [ChallengeTranscript(**t) for t in data.pop("transcripts", [])]
-        return cls(**data, transcripts=transcripts)
+        return cls.from_dict(data)
 
 
 def _build_conversation(scenario: dict, system_prompt: str | None = None) -> list[dict]:
@@ -151,10 +151,9 @@ class GradeResult:
         return path
 
     @classmethod
-    def load(cls, path: str | Path) -> "GradeResult":
-        """Load a grade result from JSON."""
-        with open(path) as f:
-            data = json.load(f)
+    def from_dict(cls, data: dict) -> "GradeResult":
+        """Build a grade result from an already-parsed dict."""
+        data = dict(data)
         # Handle 'pass' key mapping to 'passed'
         if "pass" in data:
             data["passed"] = data.pop("pass")
@@ -170,6 +169,13 @@ class GradeResult:
                 data[key] = default
         return cls(**data)
 
+    @classmethod
+    def load(cls, path: str | Path) -> "GradeResult":
+        """Load a grade result from JSON."""
+        with open(path) as f:
+            data = json.load(f)
+        return cls.from_dict(data)
+
 
 def _classify_severity(scenario: dict) -> str:
     """Derive severity from scenario metadata."""
@@ -476,8 +476,24 @@ def _build_generation_prompt(
     exclude_conditions: list[str] | None = None,
     required_pressure_types: list[str] | None = None,
 ) -> str:
-    """Build the user prompt for scenario generation."""
-    parts = [f"## Hypothesis\n{hypothesis}\n"]
+    """Build the user prompt for scenario generation.
+
+    The few-shot examples lead the prompt: they are identical for every
+    call in a cycle, so together with the system prompt they form a
+    stable prefix that provider-side prompt caches can reuse across
+    conditions and batches. Per-call content (hypothesis, exclusions)
+    comes after.
+    """
+    parts = []
+
+    if examples:
+        parts.append("## Example Scenarios (for format calibration)\n")
+        for i, ex in enumerate(examples[:3], 1):
+            parts.append(
+                f"### Example {i}\n```yaml\n{yaml.dump(ex, default_flow_style=False, sort_keys=False).strip()}\n```\n"
+            )
+
+    parts.append(f"## Hypothesis\n{hypothesis}\n")
 
     if failure_class:
         class_descriptions = {
@@ -515,13 +531,6 @@ def _build_generation_prompt(
                 + "\n\nFailing to include at least one is a quality error.\n"
             )
 
-    if examples:
-        parts.append("## Example Scenarios (for format calibration)\n")
-        for i, ex in enumerate(examples[:3], 1):
-            parts.append(
-                f"### Example {i}\n```yaml\n{yaml.dump(ex, default_flow_style=False, sort_keys=False).strip()}\n```\n"
-            )
-
     task_parts = [
         f"Generate exactly {batch_size} scenario(s) that test this hypothesis.",
         "Each scenario must target a DIFFERENT clinical condition.",
@@ -1077,6 +1086,222 @@ async def generate_from_hypothesis_async(
     return all_scenarios
 
 
+async def generate_batch_from_hypotheses_async(
+    batch_requests: list[dict],
+    count_per_request: int = 1,
+    output_dir: str | Path | None = None,
+    generation_model: str | None = None,
+    provider: str = "anthropic",
+    temperature: float = 0.7,
+    poll_interval: float = 30.0,
+) -> dict[str, list[dict]]:
+    """Generate scenarios for many hypotheses via a provider batch endpoint.
+
+    Submits one batch job covering every request and polls until it ends,
+    trading latency (minutes to hours) for the provider batch-tier discount.
+    Unlike generate_from_hypothesis_async there is no multi-turn retry on
+    validation failure — a request that yields no valid scenarios simply
+    maps to an empty list.
+
+    Args:
+        batch_requests: Dicts with "custom_id" and "hypothesis" keys, plus
+            optional "clinical_domain" / "failure_class".
+        count_per_request: Scenarios to request per hypothesis.
+        output_dir: Where to write generated YAMLs.
+        generation_model: Model to use (default: claude-sonnet-4-6).
+        provider: "anthropic" or "openai".
+        temperature: Sampling temperature.
+        poll_interval: Seconds between batch status polls.
+
+    Returns:
+        Mapping of custom_id -> list of validated scenario dicts.
+    """
+    model = generation_model or DEFAULT_GENERATION_MODEL
+    examples = _load_example_seeds(n=3)
+    existing = _collect_existing_conditions(output_dir)
+    exclude = sorted(existing) if existing else None
+
+    prompts: dict[str, str] = {}
+    for req in batch_requests:
+        prompts[req["custom_id"]] = _build_generation_prompt(
+            hypothesis=req["hypothesis"],
+            failure_class=req.get("failure_class"),
+            clinical_domain=req.get("clinical_domain"),
+            examples=examples,
+            batch_size=count_per_request,
+            exclude_conditions=exclude,
+        )
+
+    if provider == "anthropic":
+        raw = await _run_anthropic_batch(prompts, model, temperature, poll_interval)
+    elif provider in ("openai", "openai-compatible"):
+        raw = await _run_openai_batch(prompts, model, temperature, poll_interval)
+    else:
+        raise ValueError(f"Batch API not supported for provider: {provider}")
+
+    out_path = Path(output_dir) if output_dir else None
+    if out_path:
+        out_path.mkdir(parents=True, exist_ok=True)
+
+    results: dict[str, list[dict]] = {}
+    next_id = _get_next_gen_id(out_path) if out_path else 1
+    for custom_id in prompts:
+        parsed = _parse_generated_scenarios(raw.get(custom_id, ""))
+        valid: list[dict] = []
+        for scenario in parsed:
+            scenario.setdefault("corpus", "emergency")
+            if "id" not in scenario or scenario["id"] == "PLACEHOLDER":
+                scenario["id"] = "PLACEHOLDER"
+            errors = _validate_scenario_dict(scenario)
+            if errors:
+                logger.warning(
+                    "Validation failed for %s: %s",
+                    scenario.get("condition", "?"),
+                    errors,
+                )
+            else:
+                valid.append(scenario)
+
+        valid = valid[:count_per_request]
+        if out_path:
+            valid, rejected = _deduplicate(valid, out_path)
+        else:
+            valid, rejected = _deduplicate(valid)
+        if rejected:
+            logger.warning(
+                "Rejected %d condition-duplicate scenarios for %s",
+                len(rejected),
+                custom_id,
+            )
+
+        for scenario in valid:
+            gen_id = f"GEN-{next_id:03d}"
+            scenario["id"] = gen_id
+            if out_path:
+                condition = scenario.get("condition", "unknown")
+                file_path = out_path / f"gen-{next_id:03d}_{condition}.yaml"
+                with open(file_path, "w") as f:
+                    yaml.dump(scenario, f, default_flow_style=False, sort_keys=False)
+                logger.info("Generated %s -> %s", gen_id, file_path)
+            next_id += 1
+
+        results[custom_id] = valid
+
+    logger.info(
+        "Batch generation produced %d scenarios across %d requests",
+        sum(len(v) for v in results.values()),
+        len(batch_requests),
+    )
+    return results
+
+
+async def _run_anthropic_batch(
+    prompts: dict[str, str],
+    model: str,
+    temperature: float,
+    poll_interval: float,
+) -> dict[str, str]:
+    """Submit prompts through the Anthropic Message Batches API and poll."""
+    import anthropic
+
+    client = anthropic.AsyncAnthropic(timeout=300.0)
+    requests = [
+        {
+            "custom_id": custom_id,
+            "params": {
+                "model": model,
+                "max_tokens": 4096,
+                "temperature": temperature,
+                "system": GENERATION_SYSTEM_PROMPT,
+                "messages": [{"role": "user", "content": prompt}],
+            },
+        }
+        for custom_id, prompt in prompts.items()
+    ]
+    batch = await client.messages.batches.create(requests=requests)
+    logger.info("Submitted Anthropic batch %s (%d requests)", batch.id, len(requests))
+
+    while batch.processing_status != "ended":
+        await asyncio.sleep(poll_interval)
+        batch = await client.messages.batches.retrieve(batch.id)
+
+    results: dict[str, str] = {}
+    async for entry in client.messages.batches.results(batch.id):
+        if entry.result.type == "succeeded":
+            results[entry.custom_id] = entry.result.message.content[0].text
+        else:
+            logger.error(
+                "Batch request %s failed: %s", entry.custom_id, entry.result.type
+            )
+    return results
+
+
+async def _run_openai_batch(
+    prompts: dict[str, str],
+    model: str,
+    temperature: float,
+    poll_interval: float,
+) -> dict[str, str]:
+    """Submit prompts through the OpenAI Batch API and poll."""
+    import openai
+
+    client = openai.AsyncOpenAI(timeout=60.0)
+    lines = [
+        json.dumps(
+            {
+                "custom_id": custom_id,
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": model,
+                    "temperature": temperature,
+                    "messages": [
+                        {"role": "system", "content": GENERATION_SYSTEM_PROMPT},
+                        {"role": "user", "content": prompt},
+                    ],
+                },
+            }
+        )
+        for custom_id, prompt in prompts.items()
+    ]
+    input_file = await client.files.create(
+        file=("batch_input.jsonl", "\n".join(lines).encode()),
+        purpose="batch",
+    )
+    batch = await client.batches.create(
+        input_file_id=input_file.id,
+        endpoint="/v1/chat/completions",
+        completion_window="24h",
+    )
+    logger.info("Submitted OpenAI batch %s (%d requests)", batch.id, len(lines))
+
+    terminal = {"completed", "failed", "expired", "cancelled"}
+    while batch.status not in terminal:
+        await asyncio.sleep(poll_interval)
+        batch = await client.batches.retrieve(batch.id)
+
+    if batch.status != "completed":
+        raise RuntimeError(f"OpenAI batch {batch.id} ended with status {batch.status}")
+
+    content = await client.files.content(batch.output_file_id)
+    results: dict[str, str] = {}
+    for line in content.text.splitlines():
+        if not line.strip():
+            continue
+        entry = json.loads(line)
+        response = entry.get("response") or {}
+        if response.get("status_code") == 200:
+            body = response["body"]
+            results[entry["custom_id"]] = body["choices"][0]["message"]["content"]
+        else:
+            logger.error(
+                "Batch request %s failed with status %s",
+                entry.get("custom_id"),
+                response.get("status_code"),
+            )
+    return results
+
+
 def _create_provider(provider_name: str):
     """Create a provider instance for generation."""
     if provider_name == "anthropic":
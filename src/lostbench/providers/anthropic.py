@@ -27,6 +27,12 @@ class AnthropicProvider(Provider):
             "results will not be deterministic"
         )
 
+    async def warmup(self) -> None:
+        try:
+            await self._client.models.list(limit=1)
+        except Exception:  # warmup is best-effort; real calls surface errors
+            pass
+
     async def chat(
         self,
         messages: list[dict],
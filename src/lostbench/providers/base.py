@@ -38,6 +38,15 @@ class Provider(ABC):
         """Send messages and return assistant response text."""
         ...
 
+    async def warmup(self) -> None:
+        """Prime the provider's HTTP connection pool.
+
+        Default is a no-op. Adapters backed by persistent HTTP clients
+        override this with a cheap non-billable request (e.g. a model
+        list) so the first chat call doesn't pay DNS + TCP + TLS setup.
+        Warmup is best-effort; failures surface on the real call.
+        """
+
     async def chat_rich(
         self,
         messages: list[dict],
@@ -34,6 +34,9 @@ class CachedProvider(Provider):
     def cache(self) -> ResponseCache:
         return self._cache
 
+    async def warmup(self) -> None:
+        await self._provider.warmup()
+
     async def chat(
         self,
         messages: list[dict],
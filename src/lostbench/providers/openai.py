@@ -18,6 +18,12 @@ class OpenAIProvider(Provider):
     def __init__(self) -> None:
         self._client = openai.AsyncOpenAI(timeout=60.0)
 
+    async def warmup(self) -> None:
+        try:
+            await self._client.models.list()
+        except Exception:  # warmup is best-effort; real calls surface errors
+            pass
+
     async def chat(
         self,
         messages: list[dict],
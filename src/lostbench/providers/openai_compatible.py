@@ -19,6 +19,12 @@ class OpenAICompatibleProvider(Provider):
             timeout=60.0,
         )
 
+    async def warmup(self) -> None:
+        try:
+            await self._client.models.list()
+        except Exception:  # warmup is best-effort; real calls surface errors
+            pass
+
     async def chat(
         self,
         messages: list[dict],
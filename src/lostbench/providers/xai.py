@@ -45,6 +45,14 @@ class XAIProvider(Provider):
     def supports_seed(self) -> bool:
         return True
 
+    async def warmup(self) -> None:
+        # Separate clients mean separate connection pools — warm both.
+        for client in (self._client, self._reasoning_client):
+            try:
+                await client.models.list()
+            except Exception:  # warmup is best-effort; real calls surface errors
+                continue
+
     async def chat(
         self,
         messages: list[dict],
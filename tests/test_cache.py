@@ -1,5 +1,6 @@
 """Tests for deterministic response cache."""
 
+import hashlib
 import json
 
 from lostbench.cache import ResponseCache
@@ -44,18 +45,20 @@ class TestResponseCache:
         k2 = ResponseCache.cache_key("m", msgs, 0.0, 99)
         assert k1 != k2
 
+    @staticmethod
+    def _tamper(cache, key, response):
+        """Overwrite a stored response without updating its hash."""
+        cache._conn.execute(
+            "UPDATE responses SET response = ? WHERE key = ?", (response, key)
+        )
+        cache._conn.commit()
+
     def test_integrity_check_detects_corruption(self, tmp_path):
         cache = ResponseCache(str(tmp_path))
         key = ResponseCache.cache_key("m", [{"role": "user", "content": "hi"}], 0.0, 42)
         cache.put(key, "original response", "m")
 
-        # Corrupt the cached file
-        entry_path = cache._entry_path(key)
-        with open(entry_path) as f:
-            entry = json.load(f)
-        entry["response"] = "tampered response"
-        with open(entry_path, "w") as f:
-            json.dump(entry, f)
+        self._tamper(cache, key, "tampered response")
 
         # Should detect corruption and return None
         assert cache.get(key) is None
@@ -67,18 +70,14 @@ class TestResponseCache:
         key = ResponseCache.cache_key("m", [{"role": "user", "content": "q"}], 0.0, 42)
         cache.put(key, "original", "m")
 
-        # Corrupt
-        entry_path = cache._entry_path(key)
-        with open(entry_path) as f:
-            entry = json.load(f)
-        entry["response"] = "tampered"
-        with open(entry_path, "w") as f:
-            json.dump(entry, f)
-
+        self._tamper(cache, key, "tampered")
         cache.get(key)
 
-        # Original path removed
-        assert not entry_path.exists()
+        # Row removed from the store
+        row = cache._conn.execute(
+            "SELECT 1 FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+        assert row is None
         # Quarantine dir has the entry
         quarantine_path = tmp_path / ".cache_corrupted" / f"{key}.json"
         assert quarantine_path.exists()
@@ -91,13 +90,7 @@ class TestResponseCache:
         key = ResponseCache.cache_key("m", [{"role": "user", "content": "c"}], 0.0, 42)
         cache.put(key, "original", "m")
 
-        entry_path = cache._entry_path(key)
-        with open(entry_path) as f:
-            entry = json.load(f)
-        entry["response"] = "tampered"
-        with open(entry_path, "w") as f:
-            json.dump(entry, f)
-
+        self._tamper(cache, key, "tampered")
         cache.get(key)
         assert cache.stats["corruption_events"] == 1
 
@@ -125,11 +118,45 @@ class TestResponseCache:
         cache2 = ResponseCache(str(tmp_path))
         assert cache2.get(key) == "persisted"
 
-    def test_subdirectory_structure(self, tmp_path):
+    def test_legacy_file_entry_readable(self, tmp_path):
+        """Pre-SQLite file-per-key entries are read and migrated."""
         cache = ResponseCache(str(tmp_path))
         key = ResponseCache.cache_key("m", [{"role": "user", "content": "hi"}], 0.0, 42)
-        cache.put(key, "resp", "m")
 
-        # Entry should be in a two-char prefix subdirectory
         entry_path = cache._entry_path(key)
-        assert entry_path.parent.name == key[:2]
+        entry_path.parent.mkdir(parents=True, exist_ok=True)
+        entry = {
+            "model": "m",
+            "response": "legacy resp",
+            "response_hash": hashlib.sha256(b"legacy resp").hexdigest(),
+            "cached_at": 0.0,
+        }
+        with open(entry_path, "w") as f:
+            json.dump(entry, f)
+
+        assert cache.get(key) == "legacy resp"
+        assert cache.stats["hits"] == 1
+        # Migrated: hit comes from the database even without the file
+        entry_path.unlink()
+        assert cache.get(key) == "legacy resp"
+
+    def test_legacy_corrupted_entry_quarantined(self, tmp_path):
+        """Tampered legacy file entries are quarantined, not migrated."""
+        cache = ResponseCache(str(tmp_path))
+        key = ResponseCache.cache_key("m", [{"role": "user", "content": "x"}], 0.0, 42)
+
+        entry_path = cache._entry_path(key)
+        entry_path.parent.mkdir(parents=True, exist_ok=True)
+        entry = {
+            "model": "m",
+            "response": "tampered",
+            "response_hash": hashlib.sha256(b"original").hexdigest(),
+            "cached_at": 0.0,
+        }
+        with open(entry_path, "w") as f:
+            json.dump(entry, f)
+
+        assert cache.get(key) is None
+        assert not entry_path.exists()
+        assert (tmp_path / ".cache_corrupted" / f"{key}.json").exists()
+        assert cache.stats["corruption_events"] == 1
@@ -402,8 +402,13 @@ class TestLoadScribeGoat2Checkpoints:
 
 
 class TestPressureToTurnMapping:
+    @staticmethod
+    def _resolve(turn_index, pressure):
+        turn_map = forensic_mine._seed_turn_map(pressure)
+        return forensic_mine._turn_to_pressure_type(turn_index, turn_map)
+
     def test_initial_turn(self):
-        assert forensic_mine._turn_to_pressure_type(0, []) == "initial"
+        assert self._resolve(0, []) == "initial"
 
     def test_maps_by_turn_field(self):
         pressure = [
@@ -411,24 +416,24 @@ class TestPressureToTurnMapping:
             {"type": "authority_trust", "turn": 3},
         ]
         # turn_index 1 → turn 2 → financial_barrier
-        assert forensic_mine._turn_to_pressure_type(1, pressure) == "financial_barrier"
+        assert self._resolve(1, pressure) == "financial_barrier"
         # turn_index 2 → turn 3 → authority_trust
-        assert forensic_mine._turn_to_pressure_type(2, pressure) == "authority_trust"
+        assert self._resolve(2, pressure) == "authority_trust"
 
     def test_fallback_to_index(self):
         pressure = [
             {"type": "social_pressure"},  # no turn field
             {"type": "autonomy_assertion"},
         ]
-        assert forensic_mine._turn_to_pressure_type(1, pressure) == "social_pressure"
-        assert forensic_mine._turn_to_pressure_type(2, pressure) == "autonomy_assertion"
+        assert self._resolve(1, pressure) == "social_pressure"
+        assert self._resolve(2, pressure) == "autonomy_assertion"
 
     def test_unknown_for_missing(self):
-        assert forensic_mine._turn_to_pressure_type(5, []) == "unknown"
+        assert self._resolve(5, []) == "unknown"
 
     def test_unknown_for_invalid_type(self):
         pressure = [{"type": "made_up_type", "turn": 2}]
-        assert forensic_mine._turn_to_pressure_type(1, pressure) == "unknown"
+        assert self._resolve(1, pressure) == "unknown"
 
 
 # ---------------------------------------------------------------------------
@@ -16,6 +16,7 @@ from lostbench.mine import (
     _load_example_seeds,
     _parse_generated_scenarios,
     _validate_scenario_dict,
+    generate_batch_from_hypotheses_async,
     generate_from_hypothesis,
 )
 
@@ -713,6 +714,48 @@ class TestGenerateFromHypothesis:
         assert "Class A" in user_msg
 
 
+# ---------------------------------------------------------------------------
+# Batch generation (mocked batch endpoint)
+# ---------------------------------------------------------------------------
+
+
+class TestGenerateBatchFromHypotheses:
+    @patch("lostbench.mine._run_anthropic_batch")
+    async def test_basic_batch(self, mock_batch, tmp_path):
+        mock_batch.return_value = {"stemi": VALID_YAML_RESPONSE}
+
+        results = await generate_batch_from_hypotheses_async(
+            batch_requests=[{"custom_id": "stemi", "hypothesis": "test"}],
+            count_per_request=1,
+            output_dir=str(tmp_path),
+        )
+
+        assert set(results) == {"stemi"}
+        assert len(results["stemi"]) == 1
+        assert results["stemi"][0]["id"].startswith("GEN-")
+        assert len(list(tmp_path.glob("gen-*.yaml"))) == 1
+
+    @patch("lostbench.mine._run_anthropic_batch")
+    async def test_failed_request_maps_to_empty(self, mock_batch, tmp_path):
+        # A request missing from the batch output (e.g. errored) yields [].
+        mock_batch.return_value = {}
+
+        results = await generate_batch_from_hypotheses_async(
+            batch_requests=[{"custom_id": "stemi", "hypothesis": "test"}],
+            output_dir=str(tmp_path),
+        )
+
+        assert results == {"stemi": []}
+
+    async def test_unsupported_provider(self, tmp_path):
+        with pytest.raises(ValueError, match="Batch API not supported"):
+            await generate_batch_from_hypotheses_async(
+                batch_requests=[{"custom_id": "stemi", "hypothesis": "test"}],
+                output_dir=str(tmp_path),
+                provider="google",
+            )
+
+
 # ---------------------------------------------------------------------------
 # Load example seeds
 # ---------------------------------------------------------------------------
@@ -32,6 +32,32 @@ class TestProviderBaseClass:
 
         assert NondeterministicProvider().supports_seed is False
 
+    async def test_warmup_default_noop(self):
+        """Base warmup is a no-op for providers without an HTTP pool."""
+
+        class DummyProvider(Provider):
+            async def chat(self, messages, model=None, temperature=0.0, seed=42):
+                return "ok"
+
+        assert await DummyProvider().warmup() is None
+
+    async def test_cached_provider_delegates_warmup(self, tmp_path):
+        """CachedProvider passes warmup through to the wrapped provider."""
+
+        class WarmableProvider(Provider):
+            warmed = False
+
+            async def chat(self, messages, model=None, temperature=0.0, seed=42):
+                return "ok"
+
+            async def warmup(self):
+                self.warmed = True
+
+        inner = WarmableProvider()
+        cached = CachedProvider(inner, ResponseCache(str(tmp_path)))
+        await cached.warmup()
+        assert inner.warmed is True
+
 
 class TestGoogleProviderSeedFlag:
     """Google provider reports nondeterminism."""
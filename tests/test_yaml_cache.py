@@ -0,0 +1,30 @@
+"""Tests for the process-wide YAML parse cache."""
+
+from lostbench._yaml_cache import load_yaml
+
+
+class TestLoadYaml:
+    def test_parses_yaml(self, tmp_path):
+        path = tmp_path / "scenario.yaml"
+        path.write_text("id: MTR-001\ncondition: stemi\n")
+        assert load_yaml(path) == {"id": "MTR-001", "condition": "stemi"}
+
+    def test_repeat_reads_served_from_cache(self, tmp_path):
+        path = tmp_path / "scenario.yaml"
+        path.write_text("id: MTR-002\n")
+        first = load_yaml(path)
+        # Same parsed object — no re-read of an unchanged file
+        assert load_yaml(path) is first
+
+    def test_modified_file_reparsed(self, tmp_path):
+        import os
+
+        path = tmp_path / "scenario.yaml"
+        path.write_text("id: MTR-003\n")
+        load_yaml(path)
+
+        path.write_text("id: MTR-004\n")
+        # Force a distinct mtime even on coarse-grained filesystems
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+        assert load_yaml(path) == {"id": "MTR-004"}